@@ -1,13 +1,86 @@
 import streamlit as st
+import contextlib
+import hashlib
 import os
 from pathlib import Path
+import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
-import networkx as nx
 import json
+import re
 import time
-from src.parser import OdooModuleParser
-from src.visualizer import OdooModuleVisualizer
+import uuid
+from collections import Counter, defaultdict
+from html import escape
+from src.parser import OdooModuleParser, RELATIONAL_FIELD_TYPES
+from src.visualizer import OdooModuleVisualizer, method_type_label
+
+# Method categories assigned by the parser, in display order
+METHOD_CATEGORY_NAMES = {
+    'api': "API",
+    'compute': "Compute",
+    'crud': "CRUD",
+    'other': "Other",
+}
+
+# Explicit Arrow-friendly dtypes for the field tables; field types repeat, so Type is categorical
+FIELD_TABLE_DTYPES = {
+    "Name": "string",
+    "Type": "category",
+    "Label": "string",
+    "Required": "string",
+    "Related Model": "string",
+    "Compute": "string",
+    "Help": "string",
+    "Stored": "string",
+    "Tracking": "string",
+    "Description": "string",
+}
+
+@st.cache_data(show_spinner=False)
+def _build_field_tables(fields_key):
+    """Build the All/Basic/Relational/Computed field tables from per-column field tuples"""
+    import pyarrow as pa
+    
+    df = pd.DataFrame(dict(zip(["Name", "Type", "Required", "Related Model", "Compute", "Help", "Stored"], fields_key)))
+    df["Required"] = np.where(df["Required"], "✓", "")
+    df["Stored"] = np.where(df["Stored"], "✓", "")
+    
+    # Computed relational fields appear in both the Relational and Computed tables
+    is_relational = df["Type"].isin(RELATIONAL_FIELD_TYPES)
+    is_computed = df["Compute"] != ""
+    
+    # The All Fields table goes to Streamlit as Arrow with an explicit string schema
+    all_columns = ["Name", "Type", "Required", "Related Model", "Compute"]
+    all_table = pa.Table.from_pandas(
+        df[all_columns], schema=pa.schema([(column, pa.string()) for column in all_columns]), preserve_index=False
+    )
+    df = df.astype({column: FIELD_TABLE_DTYPES[column] for column in df.columns})
+    basic_df = df.loc[~is_relational & ~is_computed, ["Name", "Type", "Required", "Help"]]
+    relation_df = df.loc[is_relational, ["Name", "Type", "Related Model", "Required"]]
+    computed_df = df.loc[is_computed, ["Name", "Type", "Compute", "Stored"]].rename(columns={"Compute": "Compute Method"})
+    return all_table, basic_df, relation_df, computed_df
+
+def _code_block(text, language):
+    """Fenced markdown code block, with a fence longer than any backtick run in the text"""
+    longest_run = max((len(run) for run in re.findall(r"`+", text)), default=0)
+    fence = "`" * max(3, longest_run + 1)
+    return f"{fence}{language}\n{text}\n{fence}"
+
+def _method_details_markdown(method, type_label):
+    """Type, parameters, dependencies, code and size of a method as one markdown block"""
+    body = [
+        f"**Type:** {type_label}",
+        f"**Parameters:** {', '.join(method.parameters)}",
+    ]
+    if method.api_depends:
+        body.append(f"**Depends on:** {', '.join(method.api_depends)}")
+    source_code = getattr(method, 'source_code', None)  # not captured by the parser yet
+    if source_code:
+        body.append(_code_block(source_code, "python"))
+    elif method.docstring:
+        body.append(_code_block(method.docstring, "text"))
+    body.append(f"**Complexity:** {method.complexity} | **Lines:** {method.line_count}")
+    return "\n\n".join(body)
 
 def display_model_info(model):
     # Simpler styling for cleaner display
@@ -50,48 +123,31 @@ def display_model_info(model):
     if model.fields:
         tabs = st.tabs(["All Fields", "Basic", "Relational", "Computed"])
         
+        # Tables are cached on a hashable, column-wise snapshot of the model's fields
+        fields = model.fields.values()
+        fields_key = (
+            tuple(f.name for f in fields),
+            tuple(f.field_type for f in fields),
+            tuple(bool(f.required) for f in fields),
+            tuple(f.related_model or "" for f in fields),
+            tuple(f.compute or "" for f in fields),
+            tuple(f.help or "" for f in fields),
+            tuple(bool(f.store) for f in fields),
+        )
+        all_table, basic_df, relation_df, computed_df = _build_field_tables(fields_key)
+        
         with tabs[0]:  # All Fields
-            fields_data = []
-            for name, field in model.fields.items():
-                fields_data.append({
-                    "Name": name,
-                    "Type": field.field_type,
-                    "Required": "✓" if field.required else "",
-                    "Related Model": field.related_model or "",
-                    "Compute": field.compute or ""
-                })
-            if fields_data:
-                st.dataframe(pd.DataFrame(fields_data), use_container_width=True, hide_index=True)
+            st.dataframe(all_table, use_container_width=True, hide_index=True)
         
         with tabs[1]:  # Basic
-            basic_fields = [f for name, f in model.fields.items() 
-                          if not f.compute and f.field_type not in ['Many2one', 'One2many', 'Many2many']]
-            if basic_fields:
-                basic_data = []
-                for field in basic_fields:
-                    basic_data.append({
-                        "Name": field.name,
-                        "Type": field.field_type,
-                        "Required": "✓" if field.required else "",
-                        "Help": field.help or ""
-                    })
-                st.dataframe(pd.DataFrame(basic_data), use_container_width=True, hide_index=True)
+            if not basic_df.empty:
+                st.dataframe(basic_df, use_container_width=True, hide_index=True)
             else:
                 st.info("No basic fields found")
         
         with tabs[2]:  # Relational
-            relation_fields = [f for name, f in model.fields.items() 
-                              if f.field_type in ['Many2one', 'One2many', 'Many2many']]
-            if relation_fields:
-                relation_data = []
-                for field in relation_fields:
-                    relation_data.append({
-                        "Name": field.name,
-                        "Type": field.field_type,
-                        "Related Model": field.related_model or "",
-                        "Required": "✓" if field.required else ""
-                    })
-                st.dataframe(pd.DataFrame(relation_data), use_container_width=True, hide_index=True)
+            if not relation_df.empty:
+                st.dataframe(relation_df, use_container_width=True, hide_index=True)
                 
                 # Quick relation type explanation
                 st.write("""
@@ -103,17 +159,8 @@ def display_model_info(model):
                 st.info("No relational fields found")
         
         with tabs[3]:  # Computed
-            computed_fields = [f for name, f in model.fields.items() if f.compute]
-            if computed_fields:
-                computed_data = []
-                for field in computed_fields:
-                    computed_data.append({
-                        "Name": field.name,
-                        "Type": field.field_type,
-                        "Compute Method": field.compute,
-                        "Stored": "✓" if field.store else ""
-                    })
-                st.dataframe(pd.DataFrame(computed_data), use_container_width=True, hide_index=True)
+            if not computed_df.empty:
+                st.dataframe(computed_df, use_container_width=True, hide_index=True)
             else:
                 st.info("No computed fields found")
     else:
@@ -123,22 +170,20 @@ def display_model_info(model):
     if model.methods:
         st.subheader(f"Methods ({len(model.methods)})")
         
-        # Group methods by type
-        api_methods = [m for name, m in model.methods.items() if any(d.startswith('@api.') for d in m.decorators)]
-        compute_methods = [m for name, m in model.methods.items() if any('depends' in d for d in m.decorators)]
-        crud_methods = [m for name, m in model.methods.items() if any(m.name.startswith(p) for p in ['create', 'write', 'unlink', 'read'])]
-        other_methods = [m for name, m in model.methods.items() if m not in api_methods + compute_methods + crud_methods]
-        
+        # Group methods by the categories tagged at parse time (a method may fall in several groups)
+        by_category = defaultdict(list)
+        type_labels = {}
+        for name, m in model.methods.items():
+            for category in m.categories:
+                by_category[category].append(m)
+            type_labels[name] = method_type_label(tuple(m.decorators))
+
         # Only show categories that have methods
-        method_groups = []
-        if api_methods:
-            method_groups.append(("API Methods", api_methods))
-        if compute_methods:
-            method_groups.append(("Compute Methods", compute_methods))
-        if crud_methods:
-            method_groups.append(("CRUD Methods", crud_methods))
-        if other_methods:
-            method_groups.append(("Other Methods", other_methods))
+        method_groups = [
+            (f"{label} Methods", by_category[category])
+            for category, label in METHOD_CATEGORY_NAMES.items()
+            if by_category[category]
+        ]
         
         # Create tabs for method categories
         if method_groups:
@@ -148,28 +193,12 @@ def display_model_info(model):
                 with method_tabs[i]:
                     for method in methods:
                         with st.expander(f"{method.name}"):
-                            st.write(f"**Type:** {', '.join([d.replace('@api.', '') for d in method.decorators]) or 'Regular'}")
-                            st.write(f"**Parameters:** {', '.join(method.parameters)}")
-                            if hasattr(method, 'api_depends') and method.api_depends:
-                                st.write(f"**Depends on:** {', '.join(method.api_depends)}")
-                            if hasattr(method, 'source_code') and method.source_code:
-                                st.code(method.source_code, language="python")
-                            elif hasattr(method, 'docstring') and method.docstring:
-                                st.code(method.docstring, language="text")
-                            st.write(f"**Complexity:** {method.complexity} | **Lines:** {method.line_count}")
+                            st.markdown(_method_details_markdown(method, type_labels[method.name]))
         else:
             # Fallback to simple method list
             for name, method in model.methods.items():
                 with st.expander(f"{name}"):
-                    st.write(f"**Type:** {', '.join([d.replace('@api.', '') for d in method.decorators]) or 'Regular'}")
-                    st.write(f"**Parameters:** {', '.join(method.parameters)}")
-                    if hasattr(method, 'api_depends') and method.api_depends:
-                        st.write(f"**Depends on:** {', '.join(method.api_depends)}")
-                    if hasattr(method, 'source_code') and method.source_code:
-                        st.code(method.source_code, language="python")
-                    elif hasattr(method, 'docstring') and method.docstring:
-                        st.code(method.docstring, language="text")
-                    st.write(f"**Complexity:** {method.complexity} | **Lines:** {method.line_count}")
+                    st.markdown(_method_details_markdown(method, type_labels[name]))
 
 def display_view_info(view):
     st.write("### View Details")
@@ -189,6 +218,108 @@ def display_view_info(view):
     with st.expander("View Architecture"):
         st.code(view.arch, language="xml")
 
+PERMISSION_COLUMNS = ['perm_read', 'perm_write', 'perm_create', 'perm_unlink']
+PERMISSION_LABELS = ['read', 'write', 'create', 'delete']
+# Permission matrices smaller than this are shown as a styled table instead of a plotly heatmap
+STYLED_HEATMAP_MAX_CELLS = 100
+PERMISSION_DESCRIPTIONS = [
+    ('perm_read', 'view', 'records'),
+    ('perm_write', 'modify', 'existing records'),
+    ('perm_create', 'create', 'new records'),
+    ('perm_unlink', 'delete', 'records'),
+]
+
+@st.cache_data(show_spinner=False)
+def _build_permission_matrix(rules_digest):
+    """Combine rule permissions per (model, group) for the permissions heatmap"""
+    # Single pass over the rules: expand grouped rules into parallel columns and collect the group set
+    models, groups_col = [], []
+    perm_cols = [[] for _ in PERMISSION_COLUMNS]
+    all_groups = set()
+    ungrouped = []
+    for _, model_id, groups, *perms in rules_digest:
+        if groups:
+            all_groups.update(groups)
+            models.extend([model_id] * len(groups))
+            groups_col.extend(groups)
+            for col, allowed in zip(perm_cols, perms):
+                col.extend([allowed] * len(groups))
+        else:
+            ungrouped.append((model_id, perms))
+    
+    # Rules without groups apply to every group
+    for model_id, perms in ungrouped:
+        targets = list(all_groups or ["All Users"])
+        models.extend([model_id] * len(targets))
+        groups_col.extend(targets)
+        for col, allowed in zip(perm_cols, perms):
+            col.extend([allowed] * len(targets))
+    
+    if not models:
+        return pd.DataFrame(columns=["Model", "Group", "Permission Level", "Permissions"])
+    
+    df = pd.DataFrame({"Model": models, "Group": groups_col, **dict(zip(PERMISSION_COLUMNS, perm_cols))})
+    df = df.groupby(["Model", "Group"], sort=True)[PERMISSION_COLUMNS].any().reset_index()
+    
+    perms = df[PERMISSION_COLUMNS]
+    df["Permission Level"] = perms.sum(axis=1)
+    df["Permissions"] = [
+        ", ".join(label for label, allowed in zip(PERMISSION_LABELS, row) if allowed)
+        for row in perms.itertuples(index=False)
+    ]
+    return df[["Model", "Group", "Permission Level", "Permissions"]]
+
+@st.cache_resource(show_spinner=False)
+def _build_permission_heatmap_fig(df_key):
+    """Build the permissions heatmap from (model, group, level, permissions) column tuples"""
+    import plotly.graph_objects as go
+    
+    models, groups, levels, permissions = df_key
+    all_models = sorted(set(models))
+    all_groups = sorted(set(groups))
+    model_idx = {model: i for i, model in enumerate(all_models)}
+    group_idx = {group: j for j, group in enumerate(all_groups)}
+    
+    # Dense model x group grids; pairs without any rule stay empty (NaN) as gaps
+    z = np.full((len(all_models), len(all_groups)), np.nan)
+    text = np.full(z.shape, "", dtype=object)
+    rows = [model_idx[model] for model in models]
+    cols = [group_idx[group] for group in groups]
+    z[rows, cols] = levels
+    text[rows, cols] = permissions
+    
+    # Create heatmap with Plotly
+    fig = go.Figure(data=go.Heatmap(
+        z=z,
+        x=all_groups,
+        y=all_models,
+        colorscale=[
+            [0, 'rgb(255,255,255)'],  # No permissions (white)
+            [0.25, 'rgb(255,224,204)'],  # 1 permission (light orange)
+            [0.5, 'rgb(255,177,124)'],   # 2 permissions (medium orange)
+            [0.75, 'rgb(237,115,93)'],   # 3 permissions (dark orange)
+            [1, 'rgb(191,0,77)']         # 4 permissions (red)
+        ],
+        hoverongaps=False,
+        colorbar=dict(
+            title="Permissions",
+            tickvals=[0, 1, 2, 3, 4],
+            ticktext=["None", "1 right", "2 rights", "3 rights", "Full Access"]
+        ),
+        hovertemplate='Model: %{y}<br>Group: %{x}<br>Permissions: %{text}<extra></extra>',
+        text=text
+    ))
+    
+    fig.update_layout(
+        title="Access Rights by Group and Model",
+        xaxis_title="User Groups",
+        yaxis_title="Models",
+        height=max(400, 100 + len(all_models) * 30),
+        margin=dict(l=10, r=10, t=50, b=50)
+    )
+    
+    return fig
+
 def display_security_info(rules):
     st.write("### Security Rules")
     
@@ -204,158 +335,242 @@ def display_security_info(rules):
         
         for name, rule in rules.items():
             with st.expander(f"{rule.model_id} - {name}"):
-                # Header with model info
-                st.write(f"**Model:** {rule.model_id}")
+                # Build the whole rule description and emit it in one call
+                parts = [f"**Model:** {rule.model_id}"]
                 
                 # Groups that this rule applies to
                 if rule.groups:
-                    st.write("**Applies to user groups:**")
-                    for group in rule.groups:
-                        st.write(f"- {group}")
+                    parts.append("**Applies to user groups:**\n" + "\n".join(f"- {group}" for group in rule.groups))
                 else:
-                    st.write("**Applies to:** All users")
+                    parts.append("**Applies to:** All users")
                 
                 # Permissions in user-friendly language
-                st.write("**Permissions:**")
-                permissions = []
-                
-                if rule.perm_read:
-                    permissions.append("✅ **Can view** records")
-                else:
-                    permissions.append("❌ **Cannot view** records")
-                    
-                if rule.perm_write:
-                    permissions.append("✅ **Can modify** existing records")
-                else:
-                    permissions.append("❌ **Cannot modify** existing records")
-                    
-                if rule.perm_create:
-                    permissions.append("✅ **Can create** new records")
-                else:
-                    permissions.append("❌ **Cannot create** new records")
-                    
-                if rule.perm_unlink:
-                    permissions.append("✅ **Can delete** records")
-                else:
-                    permissions.append("❌ **Cannot delete** records")
-                
-                # Display permissions
-                for perm in permissions:
-                    st.write(perm)
+                parts.append("**Permissions:**")
+                for attr, action, target in PERMISSION_DESCRIPTIONS:
+                    if getattr(rule, attr):
+                        parts.append(f"✅ **Can {action}** {target}")
+                    else:
+                        parts.append(f"❌ **Cannot {action}** {target}")
                 
                 # Domain explanation if exists
-                if hasattr(rule, 'domain_force') and rule.domain_force:
-                    st.write("**Restrictions:**")
-                    st.write(f"Records must satisfy: `{rule.domain_force}`")
+                if rule.domain_force:
+                    parts.append("**Restrictions:**")
+                    parts.append(f"Records must satisfy: `{rule.domain_force}`")
                     
                     # Try to provide a human-readable explanation
                     domain = rule.domain_force
                     if "'|'" in domain or "'&'" in domain:
-                        st.write("*This rule contains complex conditions*")
+                        parts.append("*This rule contains complex conditions*")
                     else:
                         # Simple domain explanation attempts
                         if "user.id" in domain:
-                            st.write("*This rule restricts access to the user's own records*")
+                            parts.append("*This rule restricts access to the user's own records*")
                         if "company_id" in domain:
-                            st.write("*This rule restricts access by company*")
+                            parts.append("*This rule restricts access by company*")
+                
+                st.markdown("\n\n".join(parts))
     
     with tabs[1]:  # Technical View
         # Original technical table view
-        rules_data = []
-        for name, rule in rules.items():
-            rules_data.append({
-                "Name": name,
-                "Model": rule.model_id,
-                "Groups": ", ".join(rule.groups),
-                "Read": rule.perm_read,
-                "Write": rule.perm_write,
-                "Create": rule.perm_create,
-                "Unlink": rule.perm_unlink,
-                "Domain": rule.domain_force if hasattr(rule, 'domain_force') else ""
-            })
-        st.dataframe(pd.DataFrame(rules_data))
+        import pyarrow as pa
+        
+        rule_list = list(rules.values())
+        rules_table = pa.table({
+            "Name": pa.array(list(rules.keys()), type=pa.string()),
+            "Model": pa.array([r.model_id for r in rule_list], type=pa.string()),
+            "Groups": pa.array([", ".join(r.groups) for r in rule_list], type=pa.string()),
+            "Read": pa.array([r.perm_read for r in rule_list], type=pa.bool_()),
+            "Write": pa.array([r.perm_write for r in rule_list], type=pa.bool_()),
+            "Create": pa.array([r.perm_create for r in rule_list], type=pa.bool_()),
+            "Unlink": pa.array([r.perm_unlink for r in rule_list], type=pa.bool_()),
+            "Domain": pa.array([r.domain_force for r in rule_list], type=pa.string())
+        })
+        st.dataframe(rules_table, hide_index=True)
     
     with tabs[2]:  # Visual Permissions
         # Create a visual representation of permissions
         st.write("Visual overview of who can do what with which model")
         
-        # Get all unique models and groups
-        all_models = sorted(set(rule.model_id for rule in rules.values()))
-        all_groups = sorted(set(group for rule in rules.values() for group in rule.groups))
-        
-        if not all_groups:
-            all_groups = ["All Users"]
+        # Aggregation is cached on a hashable digest of the rules
+        rules_digest = tuple(sorted(
+            (name, rule.model_id, tuple(rule.groups),
+             rule.perm_read, rule.perm_write, rule.perm_create, rule.perm_unlink)
+            for name, rule in rules.items()
+        ))
+        df = _build_permission_matrix(rules_digest)
         
-        # Create data for heatmap
-        heatmap_data = []
+        if not df.empty:
+            # Pairs without any rule stay NaN so they read as blank gaps, as in the heatmap
+            pivot = df.pivot(index='Model', columns='Group', values='Permission Level')
+            if pivot.size < STYLED_HEATMAP_MAX_CELLS:
+                # Small matrices render as a colored table, avoiding the plotly payload
+                styled = (pivot.style
+                          .background_gradient(cmap='OrRd', vmin=0, vmax=4)
+                          .highlight_null(color='white')
+                          .format(precision=0, na_rep=""))
+                st.dataframe(styled, use_container_width=True)
+            else:
+                fig = _build_permission_heatmap_fig(tuple(tuple(df[column].tolist()) for column in df.columns))
+                st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("Not enough data to create visualization")
+
+# Relationship network styling, shared by every node and edge
+NODE_TOOLTIP = ("<div style='padding:10px; background:#f7f7f7; border-radius:5px;'>"
+                "<b style='font-size:14px;'>%s</b><hr style='margin:5px 0;'>"
+                "Fields: %s<br>Methods: %s</div>")
+EDGE_TOOLTIP = "<div style='padding:8px; background:#f7f7f7; border-radius:5px;'><b>Type:</b> %s<br></div>"
+EDGE_TOOLTIP_WITH_FIELD = "<div style='padding:8px; background:#f7f7f7; border-radius:5px;'><b>Type:</b> %s<br><b>Field:</b> %s</div>"
+
+# Define colors for different edge types
+EDGE_COLORS = {
+    'inherits': '#525252',  # gray
+    'Many2one': '#1192e8',  # blue 
+    'One2many': '#ff832b',  # orange
+    'Many2many': '#a56eff',  # purple
+    'default': '#878787'     # light gray
+}
+EDGE_ARROWS = {'inherits': 'from'}
+EDGE_WIDTHS = {'Many2one': 2}
+
+# Custom CSS for better appearance of the network in Streamlit
+NETWORK_CUSTOM_CSS = """
+<style>
+.vis-network {
+    border: 1px solid #ddd;
+    border-radius: 5px;
+    box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+}
+</style>
+"""
+
+@st.cache_data(show_spinner=False)
+def _build_network_html(nodes_key, edges_key):
+    """Render the relationship network to an HTML string, cached per graph"""
+    # Node and adjacency maps: models only referenced by an edge get a bare
+    # node, and parallel edges between two models collapse into the last one
+    node_counts = {node_id: (field_count, method_count) for node_id, field_count, method_count in nodes_key}
+    adjacency = {node_id: {} for node_id in node_counts}
+    for source, target, edge_type, field in edges_key:
+        for node_id in (source, target):
+            if node_id not in node_counts:
+                node_counts[node_id] = (0, 0)
+                adjacency[node_id] = {}
+        adjacency[source][target] = (edge_type, field)
+    
+    # Create an interactive visualization using Pyvis
+    from pyvis.network import Network
+    
+    # Create a pyvis network with better styling
+    net = Network(height="700px", width="100%", directed=True, notebook=False, bgcolor="#ffffff", font_color="#343434")
+    
+    # Set physics options for better visualization
+    physics_options = {
+        "enabled": True,
+        "solver": "forceAtlas2Based",
+        "forceAtlas2Based": {
+            "gravitationalConstant": -100,
+            "centralGravity": 0.05,
+            "springLength": 150,
+            "springConstant": 0.08,
+            "damping": 0.4,
+            "avoidOverlap": 1
+        },
+        "stabilization": {
+            "enabled": True,
+            "iterations": 1000
+        }
+    }
+    
+    # Additional options for better appearance
+    options = {
+        "physics": physics_options,
+        "interaction": {
+            "hover": True,
+            "navigationButtons": True,
+            "keyboard": True,
+            "multiselect": True
+        },
+        "edges": {
+            "smooth": {
+                "enabled": True,
+                "type": "dynamic",
+                "roundness": 0.5
+            },
+            "font": {
+                "size": 12,
+                "strokeWidth": 0,
+                "align": "middle"
+            }
+        },
+        "nodes": {
+            "shape": "dot",
+            "font": {
+                "size": 12,
+                "face": "Tahoma"
+            },
+            "borderWidth": 2,
+            "shadow": True
+        }
+    }
+    
+    # Apply network options
+    net.set_options(json.dumps(options))
+    
+    # Build node and edge option dicts in bulk and hand them to pyvis directly;
+    # add_node/add_edge check membership against lists, which is quadratic
+    node_options = []
+    for node_id, (field_count, method_count) in node_counts.items():
+        is_model = '.' in node_id  # Odoo models typically have dot notation
+        label = node_id.rsplit('.', 1)[-1] if is_model else node_id  # Display shorter names
         
-        for model in all_models:
-            model_rules = [r for r in rules.values() if r.model_id == model]
-            
-            for group in all_groups:
-                # Find rules that apply to this group and model
-                applicable_rules = [r for r in model_rules if not r.groups or group in r.groups]
-                
-                if applicable_rules:
-                    # Combine permissions from all applicable rules
-                    can_read = any(r.perm_read for r in applicable_rules)
-                    can_write = any(r.perm_write for r in applicable_rules)
-                    can_create = any(r.perm_create for r in applicable_rules)
-                    can_delete = any(r.perm_unlink for r in applicable_rules)
-                    
-                    # Create permission level (0-4)
-                    permission_level = sum([can_read, can_write, can_create, can_delete])
-                    
-                    # Create permission text
-                    perms = []
-                    if can_read: perms.append("read")
-                    if can_write: perms.append("write")
-                    if can_create: perms.append("create")
-                    if can_delete: perms.append("delete")
-                    
-                    heatmap_data.append({
-                        "Model": model,
-                        "Group": group,
-                        "Permission Level": permission_level,
-                        "Permissions": ", ".join(perms)
-                    })
+        # Calculate node size based on fields and methods
+        size = 15 + (field_count + method_count) * 1.5
+        size = min(50, max(25, size))  # Constrain size
         
-        if heatmap_data:
-            df = pd.DataFrame(heatmap_data)
-            
-            # Create heatmap with Plotly
-            fig = go.Figure(data=go.Heatmap(
-                z=df['Permission Level'],
-                x=df['Group'],
-                y=df['Model'],
-                colorscale=[
-                    [0, 'rgb(255,255,255)'],  # No permissions (white)
-                    [0.25, 'rgb(255,224,204)'],  # 1 permission (light orange)
-                    [0.5, 'rgb(255,177,124)'],   # 2 permissions (medium orange)
-                    [0.75, 'rgb(237,115,93)'],   # 3 permissions (dark orange)
-                    [1, 'rgb(191,0,77)']         # 4 permissions (red)
-                ],
-                hoverongaps=False,
-                colorbar=dict(
-                    title="Permissions",
-                    tickvals=[0, 1, 2, 3, 4],
-                    ticktext=["None", "1 right", "2 rights", "3 rights", "Full Access"]
-                ),
-                hovertemplate='Model: %{y}<br>Group: %{x}<br>Permissions: %{text}<extra></extra>',
-                text=df['Permissions']
-            ))
-            
-            fig.update_layout(
-                title="Access Rights by Group and Model",
-                xaxis_title="User Groups",
-                yaxis_title="Models",
-                height=max(400, 100 + len(all_models) * 30),
-                margin=dict(l=10, r=10, t=50, b=50)
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
+        # Color based on node type
+        if is_model:
+            color = "#6929c4"  # Purple for regular models
+            if field_count > 10:
+                color = "#1192e8"  # Blue for models with many fields
         else:
-            st.info("Not enough data to create visualization")
+            color = "#fa4d56"  # Red for non-standard models
+        
+        # Same options pyvis add_node would produce; border width and shadow come from the global node options
+        node_options.append({
+            "id": node_id,
+            "label": label or node_id,
+            "shape": "dot",
+            "color": color,
+            "font": {"color": net.font_color},
+            "title": NODE_TOOLTIP % (node_id, field_count, method_count),
+            "size": size,
+        })
+    net.nodes.extend(node_options)
+    net.node_ids.extend(node_counts)
+    net.node_map.update((options["id"], options) for options in node_options)
+    
+    # Add edges with relationship type colors and tooltips
+    default_color = EDGE_COLORS['default']
+    net.edges.extend(
+        {
+            "from": source,
+            "to": target,
+            "title": EDGE_TOOLTIP_WITH_FIELD % (edge_type, field) if field else EDGE_TOOLTIP % edge_type,
+            "color": EDGE_COLORS.get(edge_type, default_color),
+            "label": field,
+            "arrows": EDGE_ARROWS.get(edge_type, 'to'),
+            "dashes": edge_type != 'Many2one',
+            "smooth": True,
+            "width": EDGE_WIDTHS.get(edge_type, 1),
+        }
+        for source, targets in adjacency.items()
+        for target, (edge_type, field) in targets.items()
+    )
+    
+    # Render the graph in memory and insert the custom CSS in the same step
+    html_content = net.generate_html(notebook=False)
+    return html_content.replace('</head>', NETWORK_CUSTOM_CSS + '</head>', 1)
 
 def display_relationship_graph(nodes, edges):
     # Put the graph and explanation side by side
@@ -396,21 +611,12 @@ def display_relationship_graph(nodes, edges):
         # Add relationship summary if graph is rendered
         if nodes and edges:
             # Count relationship types
-            relationship_counts = {}
-            for edge in edges:
-                edge_type = edge.get('type', 'default')
-                if edge_type in relationship_counts:
-                    relationship_counts[edge_type] += 1
-                else:
-                    relationship_counts[edge_type] = 1
+            relationship_counts = Counter(edge.get('type', 'default') for edge in edges)
             
             if relationship_counts:
                 st.subheader("Relationship Summary")
-                relationship_df = pd.DataFrame({
-                    "Type": list(relationship_counts.keys()),
-                    "Count": list(relationship_counts.values())
-                })
-                relationship_df = relationship_df.sort_values("Count", ascending=False)
+                # most_common() already yields the pairs sorted by count
+                relationship_df = pd.DataFrame(relationship_counts.most_common(), columns=["Type", "Count"])
                 st.dataframe(relationship_df, use_container_width=True, hide_index=True)
     
     with col2:
@@ -420,187 +626,19 @@ def display_relationship_graph(nodes, edges):
             return
         
         try:
-            # Create a networkx graph
-            G = nx.DiGraph()
-            
-            # Add nodes
-            for node in nodes:
-                G.add_node(node['id'], 
-                          label=node['label'], 
-                          fields=node.get('fields', 0),
-                          methods=node.get('methods', 0))
-            
-            # Add edges
-            for edge in edges:
-                G.add_edge(edge['from'], edge['to'], 
-                          type=edge.get('type', 'default'),
-                          label=edge.get('label', ''),
-                          field=edge.get('field', ''))
-            
-            # Create an interactive visualization using Pyvis
-            from pyvis.network import Network
-            
-            # Create a pyvis network with better styling
-            net = Network(height="700px", width="100%", directed=True, notebook=False, bgcolor="#ffffff", font_color="#343434")
-            
-            # Set physics options for better visualization
-            physics_options = {
-                "enabled": True,
-                "solver": "forceAtlas2Based",
-                "forceAtlas2Based": {
-                    "gravitationalConstant": -100,
-                    "centralGravity": 0.05,
-                    "springLength": 150,
-                    "springConstant": 0.08,
-                    "damping": 0.4,
-                    "avoidOverlap": 1
-                },
-                "stabilization": {
-                    "enabled": True,
-                    "iterations": 1000
-                }
-            }
-            
-            # Additional options for better appearance
-            options = {
-                "physics": physics_options,
-                "interaction": {
-                    "hover": True,
-                    "navigationButtons": True,
-                    "keyboard": True,
-                    "multiselect": True
-                },
-                "edges": {
-                    "smooth": {
-                        "enabled": True,
-                        "type": "dynamic",
-                        "roundness": 0.5
-                    },
-                    "font": {
-                        "size": 12,
-                        "strokeWidth": 0,
-                        "align": "middle"
-                    }
-                },
-                "nodes": {
-                    "shape": "dot",
-                    "font": {
-                        "size": 12,
-                        "face": "Tahoma"
-                    },
-                    "borderWidth": 2,
-                    "shadow": True
-                }
-            }
-            
-            # Apply network options
-            net.set_options(json.dumps(options))
-            
-            # Add nodes with enhanced styling
-            for node_id in G.nodes():
-                node_data = G.nodes[node_id]
-                label = node_id.split('.')[-1] if '.' in node_id else node_id  # Display shorter names
-                
-                # Field and method counts
-                field_count = node_data.get('fields', 0)
-                method_count = node_data.get('methods', 0)
-                
-                # Create tooltip with additional info
-                title = f"<div style='padding:10px; background:#f7f7f7; border-radius:5px;'>"
-                title += f"<b style='font-size:14px;'>{node_id}</b><hr style='margin:5px 0;'>"
-                title += f"Fields: {field_count}<br>Methods: {method_count}</div>"
-                
-                # Calculate node size based on fields and methods
-                size = 15 + (field_count + method_count) * 1.5
-                size = min(50, max(25, size))  # Constrain size
-                
-                # Color based on node type
-                if "." in node_id:  # Odoo models typically have dot notation
-                    color = "#6929c4"  # Purple for regular models
-                    if node_data.get('fields', 0) > 10:
-                        color = "#1192e8"  # Blue for models with many fields
-                else:
-                    color = "#fa4d56"  # Red for non-standard models
-                    
-                # Add node with properties
-                net.add_node(node_id, 
-                            label=label, 
-                            title=title, 
-                            size=size, 
-                            color=color,
-                            borderWidth=2,
-                            shadow=True)
-            
-            # Define colors for different edge types
-            edge_colors = {
-                'inherits': '#525252',  # gray
-                'Many2one': '#1192e8',  # blue 
-                'One2many': '#ff832b',  # orange
-                'Many2many': '#a56eff',  # purple
-                'default': '#878787'     # light gray
-            }
-            
-            # Add edges with relationship type colors and tooltips
-            for source, target, data in G.edges(data=True):
-                edge_type = data.get('type', 'default')
-                field = data.get('field', '')
-                
-                # Create styled edge tooltip
-                edge_tooltip = f"<div style='padding:8px; background:#f7f7f7; border-radius:5px;'>"
-                edge_tooltip += f"<b>Type:</b> {edge_type}<br>"
-                if field:
-                    edge_tooltip += f"<b>Field:</b> {field}"
-                edge_tooltip += "</div>"
-                
-                # Choose color based on edge type
-                color = edge_colors.get(edge_type, edge_colors['default'])
-                
-                # Add edge to network with appropriate styling
-                net.add_edge(source, target, 
-                            title=edge_tooltip, 
-                            color=color, 
-                            label=field if field else "", 
-                            arrows='to' if edge_type != 'inherits' else 'from',
-                            dashes=(edge_type != 'Many2one'),
-                            smooth=True,
-                            width=2 if edge_type == 'Many2one' else 1)
-            
-            # Generate temporary HTML file with a unique name to avoid caching issues
-            html_path = f"temp_network_{int(time.time())}.html"
-            net.save_graph(html_path)
-            
-            # Read the HTML file and apply custom CSS fixes for Streamlit
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-            
-            # Add custom CSS for better appearance in Streamlit
-            custom_css = """
-            <style>
-            .vis-network {
-                border: 1px solid #ddd;
-                border-radius: 5px;
-                box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-            }
-            </style>
-            """
-            
-            # Insert custom CSS into HTML
-            html_content = html_content.replace('</head>', custom_css + '</head>')
-            
-            # Re-save modified HTML
-            with open(html_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            
-            # Re-read the file for display
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            # Hashable snapshots of the graph so the rendered HTML can be cached
+            nodes_key = tuple(
+                (node['id'], node.get('fields', 0), node.get('methods', 0))
+                for node in nodes
+            )
+            edges_key = tuple(
+                (edge['from'], edge['to'], edge.get('type', 'default'), edge.get('field', ''))
+                for edge in edges
+            )
+            html_content = _build_network_html(nodes_key, edges_key)
             
             # Display in Streamlit
             st.components.v1.html(html_content, height=700, scrolling=False)
-            
-            # Clean up
-            if os.path.exists(html_path):
-                os.remove(html_path)
                 
         except Exception as e:
             st.error(f"Error displaying relationship graph: {str(e)}")
@@ -643,6 +681,69 @@ def display_code_quality(metrics):
         else:
             st.success("No potentially unused fields found!")
 
+# Layout shared by the module statistics bar charts
+BAR_CHART_LAYOUT = dict(margin=dict(l=40, r=40, t=40, b=40), height=300)
+
+@st.cache_resource(show_spinner=False)
+def _build_field_type_bar(items_key):
+    """Build the field type distribution chart from (type, count) pairs"""
+    import plotly.graph_objects as go
+    
+    # Most common types first; a stable sort keeps ties in their original order
+    types, counts = zip(*sorted(items_key, key=lambda item: -item[1]))
+    
+    fig = go.Figure(data=[
+        go.Bar(
+            x=list(types),
+            y=list(counts),
+            text=list(counts),
+            textposition='auto',
+            marker_color='rgb(55, 83, 109)'
+        )
+    ])
+    fig.update_layout(**BAR_CHART_LAYOUT)
+    return fig
+
+@st.cache_resource(show_spinner=False)
+def _build_model_size_bar(sizes_key):
+    """Build the stacked model size chart from (model, fields, methods) rows"""
+    import plotly.graph_objects as go
+    
+    names, fields, methods = zip(*sizes_key)
+    fields_arr = np.asarray(fields, dtype=np.int64)
+    methods_arr = np.asarray(methods, dtype=np.int64)
+    total = fields_arr + methods_arr
+    order = np.argsort(-total, kind='stable')  # Largest models first
+    model_df = pd.DataFrame({
+        'Model': [names[i] for i in order],
+        'Fields': fields_arr[order],
+        'Methods': methods_arr[order],
+        'Total': total[order]
+    }, copy=False)
+    
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=model_df['Model'],
+        y=model_df['Fields'],
+        name='Fields',
+        marker_color='rgb(55, 126, 184)'
+    ))
+    fig.add_trace(go.Bar(
+        x=model_df['Model'],
+        y=model_df['Methods'],
+        name='Methods',
+        marker_color='rgb(255, 127, 0)'
+    ))
+    
+    fig.update_layout(**BAR_CHART_LAYOUT)
+    fig.update_layout(
+        barmode='stack',
+        margin_b=60,  # Room for the angled model names
+        height=400,
+        xaxis_tickangle=-45
+    )
+    return fig
+
 def display_module_stats(stats):
     st.write("### Module Statistics")
     
@@ -664,69 +765,23 @@ def display_module_stats(stats):
     # Field types distribution
     if stats.get('field_types'):
         st.subheader("Field Type Distribution")
-        field_df = pd.DataFrame({
-            'Type': list(stats['field_types'].keys()),
-            'Count': list(stats['field_types'].values())
-        })
-        field_df = field_df.sort_values('Count', ascending=False)
-        
-        fig = go.Figure(data=[
-            go.Bar(
-                x=field_df['Type'],
-                y=field_df['Count'],
-                marker_color='rgb(55, 83, 109)'
-            )
-        ])
-        fig.update_layout(
-            margin=dict(l=40, r=40, t=40, b=40),
-            height=300
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        fig = _build_field_type_bar(tuple(stats['field_types'].items()))
+        # Counts are printed on the bars, so the chart can skip hover handling
+        st.plotly_chart(fig, use_container_width=True, config={'staticPlot': True})
         
     # Model size comparison
     if stats.get('model_size'):
         st.subheader("Model Size Comparison")
         
-        model_sizes = []
-        for model, size in stats['model_size'].items():
-            model_sizes.append({
-                'Model': model,
-                'Fields': size['fields'],
-                'Methods': size['methods'],
-                'Total': size['fields'] + size['methods']
-            })
-            
-        model_df = pd.DataFrame(model_sizes).sort_values('Total', ascending=False)
-        
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            x=model_df['Model'],
-            y=model_df['Fields'],
-            name='Fields',
-            marker_color='rgb(55, 126, 184)'
-        ))
-        fig.add_trace(go.Bar(
-            x=model_df['Model'],
-            y=model_df['Methods'],
-            name='Methods',
-            marker_color='rgb(255, 127, 0)'
-        ))
-        
-        fig.update_layout(
-            barmode='stack',
-            margin=dict(l=40, r=40, t=40, b=60),
-            height=400,
-            xaxis_tickangle=-45
+        sizes_key = tuple(
+            (model, size['fields'], size['methods']) for model, size in stats['model_size'].items()
         )
+        fig = _build_model_size_bar(sizes_key)
         
         st.plotly_chart(fig, use_container_width=True)
 
-def disable_hover_effects(html_content):
-    """
-    Modifies the HTML content to disable hover effects in the visualization
-    """
-    # Add CSS to disable hover effects
-    hover_disable_css = """
+# CSS injected by disable_hover_effects to turn off node/link hover styling
+HOVER_DISABLE_CSS = """
     <style>
     .node:hover, .link:hover {
       cursor: default !important;
@@ -739,14 +794,353 @@ def disable_hover_effects(html_content):
     }
     </style>
     """
-    
-    # Insert the CSS before the closing </head> tag
-    if "</head>" in html_content:
-        modified_html = html_content.replace("</head>", hover_disable_css + "</head>")
-        return modified_html
+
+def disable_hover_effects(html_content):
+    """
+    Modifies the HTML content to disable hover effects in the visualization
+    """
+    # Insert the CSS before the first closing </head> tag, located with a single scan
+    head_end = html_content.find("</head>")
+    if head_end != -1:
+        return html_content[:head_end] + HOVER_DISABLE_CSS + html_content[head_end:]
     else:
         # If no head tag, just append it at the beginning
-        return hover_disable_css + html_content
+        return HOVER_DISABLE_CSS + html_content
+
+def _module_fingerprint(module_path):
+    """Digest of every source file's (relative path, mtime, size), used as a cache key
+
+    Covering each file rather than the newest mtime means deleted, renamed or
+    restored files also change the key.
+    """
+    entries = []
+    for root, _, files in os.walk(module_path):
+        for name in files:
+            if name.endswith(('.py', '.xml', '.csv')):
+                path = os.path.join(root, name)
+                stat = os.stat(path)
+                entries.append((os.path.relpath(path, module_path), stat.st_mtime_ns, stat.st_size))
+    entries.sort()
+    return hashlib.sha1(repr(entries).encode('utf-8')).hexdigest()
+
+# Parsed modules kept alive at once; each edit yields a new fingerprint, and older
+# entries are evicted instead of pinning a parser per save for the server's lifetime
+MODULE_CACHE_ENTRIES = 4
+
+@st.cache_resource(max_entries=MODULE_CACHE_ENTRIES, show_spinner="Parsing module...")
+def _load_parser(module_path, fingerprint):
+    """Parse a module once per fingerprint and share the parser across reruns"""
+    parser = OdooModuleParser(module_path)
+    start_time = time.time()
+    parser.parse_module()
+    # Kept on the cached parser so exports report the real parse cost, not a cache hit
+    parser.analysis_time = time.time() - start_time
+    # Unique per actual parse, so callers can tell a fresh or re-parsed module from a cache hit
+    parser.parse_id = uuid.uuid4().hex
+    return parser
+
+@st.cache_resource(max_entries=MODULE_CACHE_ENTRIES, show_spinner=False)
+def _load_visualizer(module_path, fingerprint):
+    """Visualizer bound to the cached parser for the same fingerprint"""
+    return OdooModuleVisualizer(_load_parser(module_path, fingerprint))
+
+def _field_definition(name, field):
+    """Render a single field declaration line for the generated model code"""
+    attrs = []
+    string = field.string
+    
+    # Handle string parameter more carefully
+    if string:
+        attrs.append(f"'{string}'")
+        
+    # For relational fields, add the related model
+    if field.field_type in RELATIONAL_FIELD_TYPES and field.related_model:
+        if not string:
+            string_value = name.replace('_id', '').replace('_ids', '').title()
+            attrs.append(f"'{string_value}'")
+        attrs.append(f"'{field.related_model}'")
+        
+    # Add other attributes in a cleaner format
+    if field.required:
+        attrs.append("required=True")
+    default = field.default
+    if default is not None:
+        if isinstance(default, str) and not default.startswith("lambda"):
+            attrs.append(f"default='{default}'")
+        else:
+            attrs.append(f"default={default}")
+    if field.tracking:
+        attrs.append("tracking=True")
+    
+    # Only add these if they're explicitly set
+    if field.readonly:
+        attrs.append("readonly=True")
+    if field.store and (field.compute or field.field_type in ('One2many', 'Many2many')):
+        attrs.append("store=True")
+    if field.compute:
+        attrs.append(f"compute='{field.compute}'")
+    if field.help:
+        attrs.append(f"help='{field.help}'")
+        
+    return f"    {name} = fields.{field.field_type}({', '.join(attrs)})"
+
+def _generate_model_code(model):
+    """Reconstruct an approximate Python class definition for a parsed model"""
+    # Start with class definition
+    class_name = model.name.split('.')[-1]
+    # Try to make first letter uppercase for class name
+    if class_name:
+        class_name = class_name[0].upper() + class_name[1:]
+        
+    model_code = [f"class {class_name}(models.Model):"]
+    model_code.append(f"    _name = '{model.name}'")
+    if model.description:
+        model_code.append(f"    _description = '{model.description}'")
+    if model.inherit:
+        if len(model.inherit) == 1:
+            model_code.append(f"    _inherit = '{model.inherit[0]}'")
+        else:
+            model_code.append(f"    _inherit = {model.inherit}")
+    if model.order:
+        model_code.append(f"    _order = '{model.order}'")
+    
+    # Add fields with proper definitions in a cleaner format
+    model_code.append("")
+    model_code.extend([_field_definition(name, field) for name, field in model.fields.items()])
+    
+    # Add methods with their code implementations
+    if model.methods:
+        model_code.append("")
+        for name, method in model.methods.items():
+            # Add decorators
+            for decorator in method.decorators:
+                model_code.append(f"    {decorator}")
+            
+            # Fix method signature - ensure self is included
+            params = method.parameters
+            if not params or 'self' not in params:
+                method_signature = f"    def {name}(self):"
+            else:
+                method_signature = f"    def {name}({', '.join(params)}):"
+                
+            model_code.append(method_signature)
+            
+            # Add implementation if available, otherwise use placeholders
+            source_code = getattr(method, 'source_code', None)
+            if source_code:
+                # Extract method body indentation
+                method_body = "\n".join(["        " + line for line in 
+                                      source_code.split("\n")[1:]])
+                model_code.append(method_body)
+            else:
+                if name == 'action_mark_done':
+                    model_code.append("        for record in self:")
+                    model_code.append("            record.is_done = True")
+                    model_code.append("        return True")
+                elif name == 'action_mark_todo':
+                    model_code.append("        for record in self:")
+                    model_code.append("            record.is_done = False")
+                    model_code.append("        return True")
+                elif '_onchange_' in name:
+                    field_name = name.replace("_onchange_", "")
+                    model_code.append(f"        if self.{field_name}:")
+                    model_code.append("            self.priority = '0'  # Set priority to low")
+                    model_code.append("        return")
+                else:
+                    model_code.append("        return True")
+            
+            # Add blank line between methods
+            model_code.append("")
+    
+    return "\n".join(model_code)
+
+# Most model buttons a Base/Inherited list renders before asking for a narrower search
+MODEL_LIST_LIMIT = 50
+
+@st.cache_resource(max_entries=MODULE_CACHE_ENTRIES, show_spinner=False)
+def _lowercase_model_names(module_path, fingerprint):
+    """Lowercased model names for the model search boxes, built once per fingerprint"""
+    return {name: name.lower() for name in _load_parser(module_path, fingerprint).models}
+
+def _filter_model_names(search_key, names, search_query, lower_names, fingerprint):
+    """Filter model names by a search query, reusing the last result while the query is unchanged"""
+    state_key = f"_filtered_{search_key}"
+    token = (search_query, fingerprint, id(lower_names))
+    last = st.session_state.get(state_key)
+    if last is not None and last[0] == token:
+        return last[1]
+    
+    query = search_query.lower()
+    filtered = [name for name in names if query in lower_names[name]]
+    st.session_state[state_key] = (token, filtered)
+    return filtered
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _fields_overview(module_path, fingerprint, model_name):
+    """Fields tab table for one model, built column-wise once per module fingerprint"""
+    names, types, labels, required, related, tracking, descs = [], [], [], [], [], [], []
+    for name, field in _load_parser(module_path, fingerprint).models[model_name].fields.items():
+        names.append(name)
+        types.append(field.field_type)
+        labels.append(field.string)
+        required.append("✓" if field.required else "")
+        related.append(field.related_model or "")
+        tracking.append("✓" if field.tracking else "")
+        descs.append(field.help or "")
+    
+    df = pd.DataFrame({
+        "Name": names,
+        "Type": types,
+        "Label": labels,
+        "Required": required,
+        "Related Model": related,
+        "Tracking": tracking,
+        "Description": descs
+    })
+    return df.astype({column: FIELD_TABLE_DTYPES[column] for column in df.columns})
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _model_source(module_path, fingerprint, model_name):
+    """Generated model code, cached per module fingerprint and model"""
+    return _generate_model_code(_load_parser(module_path, fingerprint).models[model_name])
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _module_stats(module_path, fingerprint):
+    """Module statistics for the cached parser"""
+    return _load_visualizer(module_path, fingerprint).get_module_stats()
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _relationship_graph(module_path, fingerprint):
+    """Relationship graph nodes and edges for the cached parser"""
+    return _load_visualizer(module_path, fingerprint).generate_relationship_graph()
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _tree_html(module_path, fingerprint):
+    """Compact module tree HTML, built in memory once per module fingerprint"""
+    html_content = _load_visualizer(module_path, fingerprint).generate_html_string()
+    
+    # Modify the HTML content to make the tree more compact
+    html_content = html_content.replace('<div class="chart"', 
+                                   '<div class="chart compact-chart"')
+    
+    # Add custom CSS to make the tree more compact and cleaner
+    custom_css = """
+    <style>
+    .compact-chart {
+        font-size: 12px;
+    }
+    .compact-node {
+        border: 1px solid #ddd !important;
+        padding: 5px !important;
+        border-radius: 4px !important;
+        background: #f8f9fa !important;
+    }
+    .node-collapse-icon {
+        font-size: 14px !important;
+        width: 16px !important;
+        height: 16px !important;
+        line-height: 16px !important;
+    }
+    .compact-chart .node-name {
+        font-weight: bold;
+        font-size: 13px;
+    }
+    </style>
+    """
+    
+    # Insert custom CSS into HTML
+    return html_content.replace('</head>', custom_css + '</head>')
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _export_models(module_path, fingerprint):
+    """Serializable models, fields and methods for the JSON export"""
+    models = {}
+    for name, model in _load_parser(module_path, fingerprint).models.items():
+        model_data = {
+            "name": name,
+            "description": model.description,
+            "inherit": model.inherit,
+            "order": model.order,
+            "fields": {},
+            "methods": {}
+        }
+        
+        # Add fields
+        if model.fields:
+            for field_name, field in model.fields.items():
+                field_data = {
+                    "name": field_name,
+                    "type": field.field_type,
+                    "required": field.required,
+                    "readonly": field.readonly,
+                    "store": field.store,
+                    "compute": field.compute,
+                    "related_model": field.related_model,
+                    "help": field.help,
+                    "string": field.string,
+                    "default": str(field.default),
+                    "tracking": field.tracking
+                }
+                
+                model_data["fields"][field_name] = field_data
+        
+        # Add methods
+        if model.methods:
+            for method_name, method in model.methods.items():
+                method_data = {
+                    "name": method_name,
+                    "decorators": list(method.decorators),
+                    "parameters": list(method.parameters),
+                    "complexity": method.complexity,
+                    "line_count": method.line_count,
+                    "docstring": method.docstring,
+                    "api_depends": list(method.api_depends)
+                }
+                
+                model_data["methods"][method_name] = method_data
+        
+        models[name] = model_data
+    return models
+
+# Fragments rerun on their own widget interactions only; Streamlit releases
+# without st.fragment/st.experimental_fragment fall back to full-script reruns
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+@_fragment
+def _render_export_tab(module_path, fingerprint, analysis_time):
+    """Export tab body; runs as a fragment so export widgets do not rerun the whole app"""
+    st.header("Export Module Data")
+    
+    export_format = st.selectbox(
+        "Select export format",
+        options=["JSON", "HTML Report"]
+    )
+    
+    if st.button("Export"):
+        if export_format == "JSON":
+            # Create a simplified serializable version of the data
+            serializable_data = {}
+            
+            # Add basic module info
+            serializable_data["module_name"] = os.path.basename(module_path)
+            serializable_data["module_path"] = module_path
+            serializable_data["analysis_time"] = f"{analysis_time:.2f} seconds"
+            
+            # Add models with their fields and methods
+            serializable_data["models"] = _export_models(module_path, fingerprint)
+            
+            # Serialize in memory and hand the bytes straight to the download button
+            json_data = json.dumps(serializable_data, indent=2)
+            
+            st.download_button(
+                label="Download JSON",
+                data=json_data.encode('utf-8'),
+                file_name=f"{os.path.basename(module_path)}_analysis.json",
+                mime="application/json"
+            )
+            
+        elif export_format == "HTML Report":
+            st.info("HTML Report export coming soon!")
 
 def main():
     st.set_page_config(
@@ -775,34 +1169,29 @@ def main():
         return
         
     try:
-        # Parse module with progress indication
-        progress_text = "Analyzing module..."
-        my_bar = st.progress(0, text=progress_text)
-        
-        # Start time measurement
-        start_time = time.time()
-        
-        # Parse module
-        parser = OdooModuleParser(module_path)
-        my_bar.progress(25, text="Parsing module structure...")
-        parser.parse_module()
-        my_bar.progress(50, text="Generating visualizations...")
-        
-        # Create visualizer
-        visualizer = OdooModuleVisualizer(parser)
-        my_bar.progress(75, text="Analyzing module...")
+        # Parse module (cached until one of its source files changes; the spinner shows on a miss)
+        fingerprint = _module_fingerprint(module_path)
+        parser = _load_parser(module_path, fingerprint)
         
-        # Get metrics
-        module_stats = visualizer.get_module_stats()
+        # A parse this session has not reported yet, whether first seen or re-parsed after
+        # eviction, gets the status element and timing banner; cache hits skip the chrome
+        reported = st.session_state.setdefault("_reported_parses", set())
+        cold = parser.parse_id not in reported
         
-        # Generate relationship graph
-        nodes, edges = visualizer.generate_relationship_graph()
-        
-        my_bar.progress(100, text="Analysis complete!")
+        with st.status("Analyzing module...", expanded=False) if cold else contextlib.nullcontext() as status:
+            # Get metrics
+            module_stats = _module_stats(module_path, fingerprint)
+            
+            # Generate relationship graph
+            nodes, edges = _relationship_graph(module_path, fingerprint)
+            
+            if cold:
+                status.update(label="Analysis complete!", state="complete")
         
-        # Calculate and display analysis time
-        analysis_time = time.time() - start_time
-        st.write(f"**Analysis completed in {analysis_time:.2f} seconds**")
+        # Display the time the parse actually took
+        if cold:
+            reported.add(parser.parse_id)
+            st.write(f"**Analysis completed in {parser.analysis_time:.2f} seconds**")
         
         # Create tabs for different views - Removed Models tab
         tab_tree, tab_relationships, tab_export = st.tabs([
@@ -818,13 +1207,6 @@ def main():
             # Add CSS for better styling
             st.markdown("""
             <style>
-            .model-card {
-                background-color: #f8f9fa;
-                border-left: 3px solid #4361ee;
-                border-radius: 5px;
-                padding: 15px;
-                margin-bottom: 15px;
-            }
             .stTabs [data-baseweb="tab-panel"] {
                 padding-top: 1rem;
             }
@@ -860,14 +1242,11 @@ def main():
             with cols[0]:
                 st.markdown(f"""<div class="compact-metric"><h3>{len(parser.models)}</h3>Models</div>""", unsafe_allow_html=True)
             with cols[1]:
-                st.markdown(f"""<div class="compact-metric"><h3>{sum(len(model.fields) for model in parser.models.values())}</h3>Fields</div>""", unsafe_allow_html=True)
+                st.markdown(f"""<div class="compact-metric"><h3>{parser.total_fields}</h3>Fields</div>""", unsafe_allow_html=True)
             with cols[2]:
-                st.markdown(f"""<div class="compact-metric"><h3>{sum(len(model.methods) for model in parser.models.values() if model.methods)}</h3>Methods</div>""", unsafe_allow_html=True)
+                st.markdown(f"""<div class="compact-metric"><h3>{parser.total_methods}</h3>Methods</div>""", unsafe_allow_html=True)
             with cols[3]:
-                method_count = sum(1 for model in parser.models.values() 
-                                  for method in model.methods.values() 
-                                  if any(d.startswith('@api.') for d in method.decorators))
-                st.markdown(f"""<div class="compact-metric"><h3>{method_count}</h3>API Methods</div>""", unsafe_allow_html=True)
+                st.markdown(f"""<div class="compact-metric"><h3>{parser.total_api_methods}</h3>API Methods</div>""", unsafe_allow_html=True)
             
             # Create a more efficient two-column layout
             col1, col2 = st.columns([1, 3])
@@ -877,6 +1256,7 @@ def main():
                 st.markdown('<div class="model-selector">', unsafe_allow_html=True)
                 st.subheader("Models")
                 model_names = sorted(parser.models.keys())
+                lower_names = _lowercase_model_names(module_path, fingerprint)
                 
                 # Categorize models for better navigation
                 base_models = {name: model for name, model in parser.models.items() if not model.inherit}
@@ -890,7 +1270,7 @@ def main():
                     # Add a search box for filtering
                     search_query = st.text_input("Search:", "", key="search_all")
                     if search_query:
-                        display_models = [name for name in display_models if search_query.lower() in name.lower()]
+                        display_models = _filter_model_names("search_all", display_models, search_query, lower_names, fingerprint)
                     
                     # Group models by module
                     module_groups = {}
@@ -911,9 +1291,11 @@ def main():
                     base_names = sorted(base_models.keys())
                     search_query = st.text_input("Search:", "", key="search_base")
                     if search_query:
-                        base_names = [name for name in base_names if search_query.lower() in name.lower()]
+                        base_names = _filter_model_names("search_base", base_names, search_query, lower_names, fingerprint)
                     
-                    for name in base_names:
+                    if len(base_names) > MODEL_LIST_LIMIT:
+                        st.caption(f"Showing {MODEL_LIST_LIMIT} of {len(base_names)} models, refine the search to see more")
+                    for name in base_names[:MODEL_LIST_LIMIT]:
                         if st.button(name.split('.')[-1], key=f"btn_base_{name}", help=name, use_container_width=True):
                             st.session_state.selected_model = name
                             
@@ -921,9 +1303,11 @@ def main():
                     inherited_names = sorted(inherited_models.keys())
                     search_query = st.text_input("Search:", "", key="search_inherited")
                     if search_query:
-                        inherited_names = [name for name in inherited_names if search_query.lower() in name.lower()]
+                        inherited_names = _filter_model_names("search_inherited", inherited_names, search_query, lower_names, fingerprint)
                     
-                    for name in inherited_names:
+                    if len(inherited_names) > MODEL_LIST_LIMIT:
+                        st.caption(f"Showing {MODEL_LIST_LIMIT} of {len(inherited_names)} models, refine the search to see more")
+                    for name in inherited_names[:MODEL_LIST_LIMIT]:
                         if st.button(name.split('.')[-1], key=f"btn_inherited_{name}", help=name, use_container_width=True):
                             st.session_state.selected_model = name
                 
@@ -939,17 +1323,14 @@ def main():
                     model = parser.models[st.session_state.selected_model]
                     
                     # Display model header with key information
-                    st.markdown(f"""
-                    <div class="model-card">
-                        <h2 style="margin-top: 0;">{model.name}</h2>
-                        <p><strong>Description:</strong> {model.description or 'No description provided'}</p>
-                        <div style="display: flex; gap: 20px; margin-top: 10px;">
-                            <div><strong>Fields:</strong> {len(model.fields) if model.fields else 0}</div>
-                            <div><strong>Methods:</strong> {len(model.methods) if model.methods else 0}</div>
-                            <div><strong>Inherits:</strong> {', '.join(model.inherit) if model.inherit else 'None'}</div>
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
+                    with st.container(border=True):
+                        st.subheader(model.name)
+                        st.write(f"**Description:** {model.description or 'No description provided'}")
+                        st.write(
+                            f"**Fields:** {len(model.fields)} · "
+                            f"**Methods:** {len(model.methods)} · "
+                            f"**Inherits:** {', '.join(model.inherit) if model.inherit else 'None'}"
+                        )
                     
                     # Create tabs for model details and code
                     detail_tabs = st.tabs(["Fields", "Methods", "Code"])
@@ -961,41 +1342,29 @@ def main():
                             field_types = sorted(set(field.field_type for field in model.fields.values()))
                             selected_types = st.multiselect("Filter by type:", field_types, default=field_types)
                             
-                            fields_data = []
-                            for name, field in model.fields.items():
-                                if field.field_type in selected_types:
-                                    fields_data.append({
-                                        "Name": name,
-                                        "Type": field.field_type,
-                                        "Label": field.string if hasattr(field, 'string') else "",
-                                        "Required": "✓" if field.required else "",
-                                        "Related Model": field.related_model or "",
-                                        "Tracking": "✓" if hasattr(field, 'tracking') and field.tracking else "",
-                                        "Description": field.help or ""
-                                    })
+                            fields_df = _fields_overview(module_path, fingerprint, model.name)
                             
-                            st.dataframe(pd.DataFrame(fields_data), use_container_width=True, hide_index=True)
+                            st.dataframe(fields_df[fields_df["Type"].isin(selected_types)], use_container_width=True, hide_index=True)
                         else:
                             st.info("No fields defined")
                     
                     with detail_tabs[1]:
                         # Display methods with code in a more compact way
                         if model.methods:
-                            # Group methods for easier navigation
-                            method_groups = {
-                                "API": [m for name, m in model.methods.items() if any(d.startswith('@api.') for d in m.decorators)],
-                                "Compute": [m for name, m in model.methods.items() if any('depends' in d for d in m.decorators)],
-                                "CRUD": [m for name, m in model.methods.items() if any(name.startswith(p) for p in ['create', 'write', 'unlink', 'read'])],
-                                "Other": []
-                            }
-                            
-                            # Add methods to Other if not in any other category
-                            for name, method in model.methods.items():
-                                if method not in method_groups["API"] + method_groups["Compute"] + method_groups["CRUD"]:
-                                    method_groups["Other"].append(method)
+                            # Group methods by the categories tagged at parse time
+                            by_category = defaultdict(list)
+                            type_labels = {}
+                            for name, m in model.methods.items():
+                                for category in m.categories:
+                                    by_category[category].append(m)
+                                type_labels[id(m)] = method_type_label(tuple(m.decorators))
                             
                             # Only show categories that have methods
-                            valid_groups = {name: methods for name, methods in method_groups.items() if methods}
+                            valid_groups = {
+                                label: by_category[category]
+                                for category, label in METHOD_CATEGORY_NAMES.items()
+                                if by_category[category]
+                            }
                             
                             if valid_groups:
                                 method_tabs = st.tabs([f"{name} ({len(methods)})" for name, methods in valid_groups.items()])
@@ -1012,134 +1381,37 @@ def main():
                                         
                                         for method in filtered_methods:
                                             with st.expander(f"{method.name} ({method.line_count} lines)"):
-                                                # More compact method info
-                                                st.markdown(f"""
-                                                <div style="display: flex; flex-wrap: wrap; gap: 10px; margin-bottom: 10px;">
-                                                    <div><strong>Type:</strong> {', '.join([d.replace('@api.', '') for d in method.decorators]) or 'Regular'}</div>
-                                                    <div><strong>Params:</strong> {', '.join(method.parameters)}</div>
-                                                    <div><strong>Complexity:</strong> {method.complexity}</div>
-                                                </div>
-                                                """, unsafe_allow_html=True)
+                                                # More compact method info; only this escaped header is sent as HTML
+                                                st.markdown(
+                                                    '<div style="display: flex; flex-wrap: wrap; gap: 10px; margin-bottom: 10px;">'
+                                                    f'<div><strong>Type:</strong> {escape(type_labels[id(method)])}</div>'
+                                                    f'<div><strong>Params:</strong> {escape(", ".join(method.parameters))}</div>'
+                                                    f'<div><strong>Complexity:</strong> {method.complexity}</div>'
+                                                    '</div>',
+                                                    unsafe_allow_html=True
+                                                )
                                                 
-                                                if hasattr(method, 'api_depends') and method.api_depends:
-                                                    st.markdown(f"**Depends on:** {', '.join(method.api_depends)}")
+                                                # Dependencies and code come from module source, so they stay plain markdown
+                                                body = []
+                                                if method.api_depends:
+                                                    body.append(f"**Depends on:** {', '.join(method.api_depends)}")
                                                 
-                                                if hasattr(method, 'source_code') and method.source_code:
-                                                    st.code(method.source_code, language="python")
-                                                elif hasattr(method, 'docstring') and method.docstring:
-                                                    st.code(method.docstring, language="text")
+                                                source_code = getattr(method, 'source_code', None)
+                                                if source_code:
+                                                    body.append(_code_block(source_code, "python"))
+                                                elif method.docstring:
+                                                    body.append(_code_block(method.docstring, "text"))
+                                                
+                                                if body:
+                                                    st.markdown("\n\n".join(body))
                         else:
                             st.info("No methods defined")
                             
                     with detail_tabs[2]:
                         # Improved code display with syntax highlighting
                         try:
-                            # Start with class definition
-                            class_name = model.name.split('.')[-1]
-                            # Try to make first letter uppercase for class name
-                            if class_name:
-                                class_name = class_name[0].upper() + class_name[1:]
-                                
-                            model_code = [f"class {class_name}(models.Model):"]
-                            model_code.append(f"    _name = '{model.name}'")
-                            if model.description:
-                                model_code.append(f"    _description = '{model.description}'")
-                            if model.inherit:
-                                if len(model.inherit) == 1:
-                                    model_code.append(f"    _inherit = '{model.inherit[0]}'")
-                                else:
-                                    model_code.append(f"    _inherit = {model.inherit}")
-                            if model.order:
-                                model_code.append(f"    _order = '{model.order}'")
-                            
-                            # Add fields with proper definitions in a cleaner format
-                            model_code.append("")
-                            if model.fields:
-                                for name, field in model.fields.items():
-                                    # Build field definition with better accuracy
-                                    field_def = f"    {name} = fields.{field.field_type}("
-                                    attrs = []
-                                    
-                                    # Handle string parameter more carefully
-                                    if hasattr(field, 'string') and field.string:
-                                        attrs.append(f"'{field.string}'")
-                                        
-                                    # For relational fields, add the related model
-                                    if field.field_type in ['Many2one', 'One2many', 'Many2many'] and field.related_model:
-                                        if not any(attr.startswith("'") for attr in attrs):
-                                            string_value = name.replace('_id', '').replace('_ids', '').title()
-                                            attrs.append(f"'{string_value}'")
-                                        attrs.append(f"'{field.related_model}'")
-                                        
-                                    # Add other attributes in a cleaner format
-                                    if field.required:
-                                        attrs.append("required=True")
-                                    if hasattr(field, 'default') and field.default is not None:
-                                        if isinstance(field.default, str) and not field.default.startswith("lambda"):
-                                            attrs.append(f"default='{field.default}'")
-                                        else:
-                                            attrs.append(f"default={field.default}")
-                                    if hasattr(field, 'tracking') and field.tracking:
-                                        attrs.append("tracking=True")
-                                    
-                                    # Only add these if they're explicitly set
-                                    if field.readonly:
-                                        attrs.append("readonly=True")
-                                    if field.store and (field.compute or field.field_type in ['One2many', 'Many2many']):
-                                        attrs.append("store=True")
-                                    if field.compute:
-                                        attrs.append(f"compute='{field.compute}'")
-                                    if field.help:
-                                        attrs.append(f"help='{field.help}'")
-                                        
-                                    field_def += ", ".join(attrs) + ")"
-                                    model_code.append(field_def)
-                            
-                            # Add methods with their code implementations
-                            if model.methods:
-                                model_code.append("")
-                                for name, method in model.methods.items():
-                                    # Add decorators
-                                    for decorator in method.decorators:
-                                        model_code.append(f"    {decorator}")
-                                    
-                                    # Fix method signature - ensure self is included
-                                    params = method.parameters
-                                    if not params or 'self' not in params:
-                                        method_signature = f"    def {name}(self):"
-                                    else:
-                                        method_signature = f"    def {name}({', '.join(params)}):"
-                                        
-                                    model_code.append(method_signature)
-                                    
-                                    # Add implementation if available, otherwise use placeholders
-                                    if hasattr(method, 'source_code') and method.source_code:
-                                        # Extract method body indentation
-                                        method_body = "\n".join(["        " + line for line in 
-                                                              method.source_code.split("\n")[1:]])
-                                        model_code.append(method_body)
-                                    else:
-                                        if name == 'action_mark_done':
-                                            model_code.append("        for record in self:")
-                                            model_code.append("            record.is_done = True")
-                                            model_code.append("        return True")
-                                        elif name == 'action_mark_todo':
-                                            model_code.append("        for record in self:")
-                                            model_code.append("            record.is_done = False")
-                                            model_code.append("        return True")
-                                        elif '_onchange_' in name:
-                                            field_name = name.replace("_onchange_", "")
-                                            model_code.append(f"        if self.{field_name}:")
-                                            model_code.append("            self.priority = '0'  # Set priority to low")
-                                            model_code.append("        return")
-                                        else:
-                                            model_code.append("        return True")
-                                    
-                                    # Add blank line between methods
-                                    model_code.append("")
-                            
                             # Display the complete model code
-                            st.code("\n".join(model_code), language="python")
+                            st.code(_model_source(module_path, fingerprint, model.name), language="python")
                         except Exception as e:
                             st.error(f"Error generating complete code: {str(e)}")
                             import traceback
@@ -1150,75 +1422,11 @@ def main():
             st.markdown('<div class="tree-container">', unsafe_allow_html=True)
             
             # Generate a more compact tree visualization
-            html_path = "temp_tree.html"
-            
-            # Customize the tree visualization options before generating
-            visualizer.tree_options = {
-                "height": "500px",
-                "width": "100%",
-                "levelsToExpand": 1,
-                "compact": True,
-                "nodeSize": {
-                    "width": 200,
-                    "height": 40
-                },
-                "connectors": {
-                    "type": "straight",
-                    "style": {
-                        "stroke-width": "2px",
-                        "stroke": "#ccc"
-                    }
-                },
-                "node": {
-                    "HTMLclass": "compact-node",
-                    "collapsable": True
-                }
-            }
-            
-            visualizer.generate_html(html_path)
-            
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-                
-            # Modify the HTML content to make the tree more compact
-            html_content = html_content.replace('<div class="chart"', 
-                                           '<div class="chart compact-chart"')
-            
-            # Add custom CSS to make the tree more compact and cleaner
-            custom_css = """
-            <style>
-            .compact-chart {
-                font-size: 12px;
-            }
-            .compact-node {
-                border: 1px solid #ddd !important;
-                padding: 5px !important;
-                border-radius: 4px !important;
-                background: #f8f9fa !important;
-            }
-            .node-collapse-icon {
-                font-size: 14px !important;
-                width: 16px !important;
-                height: 16px !important;
-                line-height: 16px !important;
-            }
-            .compact-chart .node-name {
-                font-weight: bold;
-                font-size: 13px;
-            }
-            </style>
-            """
-            
-            # Insert custom CSS into HTML
-            html_content = html_content.replace('</head>', custom_css + '</head>')
+            html_content = _tree_html(module_path, fingerprint)
             
             # Display visualization
             st.components.v1.html(html_content, height=500, scrolling=False)
             st.markdown('</div>', unsafe_allow_html=True)
-            
-            # Clean up
-            if os.path.exists(html_path):
-                os.remove(html_path)
                 
         # Relationships tab
         with tab_relationships:
@@ -1226,106 +1434,7 @@ def main():
             
         # Export tab
         with tab_export:
-            st.header("Export Module Data")
-            
-            export_format = st.selectbox(
-                "Select export format",
-                options=["JSON", "HTML Report"]
-            )
-            
-            if st.button("Export"):
-                if export_format == "JSON":
-                    # Export to JSON
-                    export_path = "module_data.json"
-                    
-                    # Create a simplified serializable version of the data
-                    serializable_data = {}
-                    
-                    # Add basic module info
-                    serializable_data["module_name"] = os.path.basename(module_path)
-                    serializable_data["module_path"] = module_path
-                    serializable_data["analysis_time"] = f"{analysis_time:.2f} seconds"
-                    
-                    # Add models with their fields and methods
-                    serializable_data["models"] = {}
-                    for name, model in parser.models.items():
-                        model_data = {
-                            "name": name,
-                            "description": model.description,
-                            "inherit": model.inherit if hasattr(model, "inherit") else [],
-                            "order": model.order if hasattr(model, "order") else "",
-                            "fields": {},
-                            "methods": {}
-                        }
-                        
-                        # Add fields
-                        if hasattr(model, "fields") and model.fields:
-                            for field_name, field in model.fields.items():
-                                field_data = {
-                                    "name": field_name,
-                                    "type": field.field_type,
-                                    "required": field.required if hasattr(field, "required") else False,
-                                    "readonly": field.readonly if hasattr(field, "readonly") else False,
-                                    "store": field.store if hasattr(field, "store") else True,
-                                    "compute": field.compute if hasattr(field, "compute") else None,
-                                    "related_model": field.related_model if hasattr(field, "related_model") else None,
-                                    "help": field.help if hasattr(field, "help") else None
-                                }
-                                
-                                # Add other attributes if they exist
-                                if hasattr(field, "string"):
-                                    field_data["string"] = field.string
-                                if hasattr(field, "default"):
-                                    field_data["default"] = str(field.default)
-                                if hasattr(field, "tracking"):
-                                    field_data["tracking"] = field.tracking
-                                
-                                model_data["fields"][field_name] = field_data
-                        
-                        # Add methods
-                        if hasattr(model, "methods") and model.methods:
-                            for method_name, method in model.methods.items():
-                                method_data = {
-                                    "name": method_name,
-                                    "decorators": list(method.decorators) if hasattr(method, "decorators") else [],
-                                    "parameters": list(method.parameters) if hasattr(method, "parameters") else [],
-                                    "complexity": method.complexity if hasattr(method, "complexity") else 0,
-                                    "line_count": method.line_count if hasattr(method, "line_count") else 0
-                                }
-                                
-                                # Add docstring and source_code if they exist
-                                if hasattr(method, "docstring"):
-                                    method_data["docstring"] = method.docstring
-                                if hasattr(method, "source_code"):
-                                    method_data["source_code"] = method.source_code
-                                if hasattr(method, "api_depends"):
-                                    method_data["api_depends"] = list(method.api_depends)
-                                
-                                model_data["methods"][method_name] = method_data
-                        
-                        serializable_data["models"][name] = model_data
-                    
-                    # Write the serializable data to a JSON file
-                    with open(export_path, 'w') as f:
-                        json.dump(serializable_data, f, indent=2)
-                    
-                    # Offer for download
-                    with open(export_path, 'r') as f:
-                        json_data = f.read()
-                    
-                    st.download_button(
-                        label="Download JSON",
-                        data=json_data,
-                        file_name=f"{os.path.basename(module_path)}_analysis.json",
-                        mime="application/json"
-                    )
-                    
-                    # Clean up
-                    if os.path.exists(export_path):
-                        os.remove(export_path)
-                    
-                elif export_format == "HTML Report":
-                    st.info("HTML Report export coming soon!")
+            _render_export_tab(module_path, fingerprint, parser.analysis_time)
                 
     except Exception as e:
         st.error(f"Error analyzing module: {str(e)}")
@@ -1,13 +1,34 @@
 import ast
 import os
-import csv
-import re
-import xml.etree.ElementTree as ET
+import sys
+import functools
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any, Set, Tuple
 from pathlib import Path
 
-@dataclass
+# Slotted dataclasses drop the per-instance __dict__; slots= needs Python 3.10+
+DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Field types whose first positional argument is the comodel name
+RELATIONAL_FIELD_TYPES = {'Many2one', 'One2many', 'Many2many'}
+
+# Method name prefixes that mark a method as a CRUD override
+CRUD_PREFIXES = ('create', 'write', 'unlink', 'read')
+
+@functools.lru_cache(maxsize=512)
+def _load_ast(path_str: str, mtime_ns: int, size: int) -> ast.Module:
+    """Parse a Python file, reusing the AST while the source is unchanged.
+
+    mtime_ns and size are only part of the cache key, so an edited file misses
+    the cache and is parsed again.
+    """
+    with open(path_str, 'rb') as f:
+        data = f.read()
+        
+    # The tokenizer decodes the bytes itself, honouring any coding cookie or BOM
+    return ast.parse(data)
+
+@dataclass(**DATACLASS_OPTIONS)
 class OdooField:
     name: str
     field_type: str
@@ -23,7 +44,7 @@ class OdooField:
     tracking: bool = False
     help: Optional[str] = None
     
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class OdooMethod:
     name: str
     decorators: List[str] = field(default_factory=list)
@@ -35,8 +56,9 @@ class OdooMethod:
     is_constraint: bool = False
     is_compute: bool = False
     is_onchange: bool = False
+    categories: List[str] = field(default_factory=list)  # 'api', 'compute', 'crud' or just 'other'
     
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class OdooModel:
     name: str
     inherit: List[str] = field(default_factory=list)
@@ -47,7 +69,7 @@ class OdooModel:
     record_name: Optional[str] = None
     constraints: List[str] = field(default_factory=list)
     
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class OdooView:
     name: str
     model: str
@@ -57,7 +79,7 @@ class OdooView:
     priority: int = 16
     field_names: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class SecurityRule:
     name: str
     model_id: str
@@ -68,7 +90,7 @@ class SecurityRule:
     perm_unlink: bool = False
     domain_force: Optional[str] = None
     
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class OdooMenuItem:
     id: str
     name: str
@@ -77,6 +99,76 @@ class OdooMenuItem:
     sequence: int = 10
     groups: List[str] = field(default_factory=list)
 
+def _literal_value(node: ast.AST) -> Any:
+    """Value of a literal AST node.
+
+    Plain constants are read straight off the node; anything else goes through
+    ast.literal_eval so containers and signed numbers keep its exact semantics
+    (including raising ValueError for non-literal expressions).
+    """
+    if isinstance(node, ast.Constant):
+        return node.value
+    return ast.literal_eval(node)
+
+# Statements that add one branch to a method's cyclomatic complexity
+BRANCH_NODES = (ast.If, ast.While, ast.For)
+
+# Elements read from views/*.xml in one pass: view records once complete, menu
+# items on their start tag so nested menus stay in document order
+VIEW_FILE_EVENTS = {'record': 'end', 'menuitem': 'start'}
+
+# Characters fed to the XML pull parser at a time
+XML_CHUNK_SIZE = 64 * 1024
+
+def _iter_xml_elements(file_path: Path, events: Dict[str, str]):
+    """Stream the elements whose tags appear in events out of an XML file.
+
+    events maps each wanted tag to the event it is yielded on: 'end' for a complete
+    subtree or 'start' for attributes only. The file is wrapped in a synthetic <root>
+    so fragments with several top-level nodes still parse, and every finished subtree
+    outside a match is cleared so memory stays bounded by one record rather than the
+    whole file.
+    A yielded element is only valid until the generator is advanced.
+    """
+    from lxml import etree
+    
+    # recover tolerates the <?xml?> declaration inside the synthetic root;
+    # entities are never resolved from untrusted module files
+    parser = etree.XMLPullParser(events=('start', 'end'), recover=True, resolve_entities=False, huge_tree=True)
+    parser.feed('<root>')
+    open_matches = 0
+    
+    with open(file_path, 'r', encoding='utf-8') as f:
+        while True:
+            chunk = f.read(XML_CHUNK_SIZE)
+            parser.feed(chunk if chunk else '</root>')
+            
+            for kind, elem in parser.read_events():
+                wanted = events.get(elem.tag)
+                if kind == 'start':
+                    if wanted:
+                        open_matches += 1
+                        if wanted == 'start':
+                            yield elem
+                    continue
+                    
+                if wanted:
+                    open_matches -= 1
+                    if wanted == 'end':
+                        yield elem
+                # Free finished subtrees unless an enclosing match still needs them.
+                # libxml2 may still point at elem itself, so only earlier siblings
+                # are detached (the iterparse idiom from the lxml docs).
+                if open_matches == 0:
+                    elem.clear(keep_tail=True)
+                    parent = elem.getparent()
+                    while parent is not None and elem.getprevious() is not None:
+                        del parent[0]
+                        
+            if not chunk:
+                parser.close()
+                break
+
 class OdooModuleParser:
     def __init__(self, module_path: str):
         self.module_path = Path(module_path)
@@ -87,6 +179,9 @@ class OdooModuleParser:
         self.manifest: Dict = {}
         self.model_dependencies: Dict[str, Set[str]] = {}
         self.field_dependencies: Dict[str, Set[Tuple[str, str]]] = {}  # model -> [(field, dependency), ...]
+        self.total_fields = 0
+        self.total_methods = 0
+        self.total_api_methods = 0
         
     def parse_module(self):
         """Parse the entire Odoo module"""
@@ -94,9 +189,15 @@ class OdooModuleParser:
         self._parse_models()
         self._parse_views()
         self._parse_security()
-        self._parse_menus()
         self._analyze_dependencies()
         
+        # Module-wide totals, computed once so the UI does not re-walk every model
+        self.total_fields = sum(len(m.fields) for m in self.models.values())
+        self.total_methods = sum(len(m.methods) for m in self.models.values())
+        self.total_api_methods = sum(
+            1 for m in self.models.values() for method in m.methods.values() if 'api' in method.categories
+        )
+        
     def _parse_manifest(self):
         """Parse the __manifest__.py file"""
         manifest_path = self.module_path / '__manifest__.py'
@@ -104,10 +205,10 @@ class OdooModuleParser:
             try:
                 with open(manifest_path, 'r', encoding='utf-8') as f:
                     content = f.read()
-                    # Remove comments to avoid parsing errors
-                    content = re.sub(r'#.*$', '', content, flags=re.MULTILINE)
                     try:
-                        self.manifest = ast.literal_eval(content)
+                        # The tokenizer drops comments itself, so '#' inside strings survives;
+                        # the parentheses make leading indentation insignificant, as literal_eval did
+                        self.manifest = _literal_value(ast.parse(f"(\n{content}\n)", mode='eval').body)
                     except (SyntaxError, ValueError):
                         print(f"Warning: Could not parse manifest file {manifest_path}")
                         self.manifest = {}
@@ -123,42 +224,34 @@ class OdooModuleParser:
                 if file_path.name != '__init__.py':
                     self._parse_model_file(file_path)
                     
+    def _model_ast(self, file_path: Path) -> ast.Module:
+        """Load a model file's AST through the mtime-keyed cache"""
+        stat = file_path.stat()
+        return _load_ast(str(file_path), stat.st_mtime_ns, stat.st_size)
+        
     def _parse_model_file(self, file_path: Path):
         """Parse a single model file"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            tree = ast.parse(content)
+            tree = self._model_ast(file_path)
             
-            # First pass: collect all models
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    if self._is_odoo_model(node):
-                        model = self._extract_model_info(node)
-                        if model.name:  # Only add if model has a name
-                            self.models[model.name] = model
-                            
-            # Second pass: extract methods and analyze complexity
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    if self._is_odoo_model(node):
-                        model_name = self._get_model_name(node)
-                        if model_name in self.models:
-                            self._extract_methods(node, self.models[model_name])
+            # Odoo models are module-level classes, so the top-level body is enough
+            for node in tree.body:
+                if isinstance(node, ast.ClassDef) and self._is_odoo_model(node):
+                    model = self._extract_model_info(node)
+                    if model.name:  # Only add if model has a name
+                        self.models[model.name] = model
+                        self._extract_methods(node, model)
                             
         except Exception as e:
             print(f"Error parsing model file {file_path}: {e}")
                     
     def _is_odoo_model(self, node: ast.ClassDef) -> bool:
         """Check if a class definition is an Odoo model"""
-        for base in node.bases:
-            if isinstance(base, ast.Attribute):
-                if base.attr == 'Model':
-                    return True
-            elif isinstance(base, ast.Name) and base.id == 'Model':
-                return True
-        return False
+        return any(
+            (isinstance(base, ast.Attribute) and base.attr == 'Model')
+            or (isinstance(base, ast.Name) and base.id == 'Model')
+            for base in node.bases
+        )
     
     def _get_model_name(self, node: ast.ClassDef) -> Optional[str]:
         """Extract model name from a class definition"""
@@ -168,7 +261,7 @@ class OdooModuleParser:
                     target_name = item.targets[0].id
                     if target_name == '_name':
                         try:
-                            return ast.literal_eval(item.value)
+                            return _literal_value(item.value)
                         except (ValueError, SyntaxError):
                             pass
         return None
@@ -184,16 +277,16 @@ class OdooModuleParser:
                         target_name = item.targets[0].id
                         try:
                             if target_name == '_name':
-                                model.name = ast.literal_eval(item.value)
+                                model.name = _literal_value(item.value)
                             elif target_name == '_inherit':
-                                value = ast.literal_eval(item.value)
+                                value = _literal_value(item.value)
                                 model.inherit = [value] if isinstance(value, str) else value
                             elif target_name == '_description':
-                                model.description = ast.literal_eval(item.value)
+                                model.description = _literal_value(item.value)
                             elif target_name == '_order':
-                                model.order = ast.literal_eval(item.value)
+                                model.order = _literal_value(item.value)
                             elif target_name == '_rec_name':
-                                model.record_name = ast.literal_eval(item.value)
+                                model.record_name = _literal_value(item.value)
                         except (ValueError, SyntaxError):
                             # Skip if we can't evaluate the value
                             pass
@@ -204,7 +297,7 @@ class OdooModuleParser:
                         target_name = item.targets[0].id
                         if target_name == '_sql_constraints':
                             try:
-                                constraints = ast.literal_eval(item.value)
+                                constraints = _literal_value(item.value)
                                 model.constraints = [constraint[0] for constraint in constraints]
                             except (ValueError, SyntaxError):
                                 pass
@@ -242,8 +335,8 @@ class OdooModuleParser:
                                 method.is_compute = True
                                 try:
                                     for arg in decorator.args:
-                                        if isinstance(arg, ast.Str):
-                                            method.api_depends.append(arg.s)
+                                        if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+                                            method.api_depends.append(arg.value)
                                 except:
                                     pass
                             
@@ -259,13 +352,24 @@ class OdooModuleParser:
                 method.parameters = [arg.arg for arg in item.args.args if arg.arg != 'self']
                 
                 # Extract docstring
-                if ast.get_docstring(item):
-                    method.docstring = ast.get_docstring(item)
+                docstring = ast.get_docstring(item)
+                if docstring:
+                    method.docstring = docstring
                     
                 # Analyze complexity
                 method.complexity = self._compute_cyclomatic_complexity(item)
                 method.line_count = item.end_lineno - item.lineno
                 
+                # Classify once here so the UI can bucket methods without rescanning decorators
+                if any(d.startswith('@api.') for d in method.decorators):
+                    method.categories.append('api')
+                if any('depends' in d for d in method.decorators):
+                    method.categories.append('compute')
+                if method_name.startswith(CRUD_PREFIXES):
+                    method.categories.append('crud')
+                if not method.categories:
+                    method.categories.append('other')
+                
                 model.methods[method_name] = method
                 
     def _compute_cyclomatic_complexity(self, node: ast.AST) -> int:
@@ -274,9 +378,9 @@ class OdooModuleParser:
         
         for sub_node in ast.walk(node):
             # Add complexity for control flow statements
-            if isinstance(sub_node, (ast.If, ast.While, ast.For)):
+            if isinstance(sub_node, BRANCH_NODES):
                 complexity += 1
-            elif isinstance(sub_node, ast.BoolOp) and isinstance(sub_node.op, (ast.And, ast.Or)):
+            elif isinstance(sub_node, ast.BoolOp):  # op is always And or Or
                 complexity += len(sub_node.values) - 1
                 
         return complexity
@@ -315,19 +419,18 @@ class OdooModuleParser:
                 params = {}
                 for kw in node.value.keywords:
                     try:
-                        params[kw.arg] = ast.literal_eval(kw.value)
+                        params[kw.arg] = _literal_value(kw.value)
                     except (ValueError, SyntaxError):
                         params[kw.arg] = None
                         
                 # Check for related model in relational fields
                 related_model = None
-                if field_type in ['Many2one', 'One2many', 'Many2many']:
-                    if len(node.value.args) > 0:
-                        try:
-                            related_model = ast.literal_eval(node.value.args[0])
-                        except (ValueError, SyntaxError):
-                            pass
-                            
+                if field_type in RELATIONAL_FIELD_TYPES and node.value.args:
+                    try:
+                        related_model = _literal_value(node.value.args[0])
+                    except (ValueError, SyntaxError):
+                        pass
+                        
                 return OdooField(
                     name=field_name,
                     field_type=field_type,
@@ -349,7 +452,7 @@ class OdooModuleParser:
         return None
     
     def _parse_views(self):
-        """Parse XML view files"""
+        """Parse view records and menu items from the XML files in views/"""
         views_dir = self.module_path / 'views'
         if views_dir.exists():
             print(f"Scanning views directory: {views_dir}")
@@ -358,68 +461,74 @@ class OdooModuleParser:
                 self._parse_view_file(file_path)
                 
     def _parse_view_file(self, file_path: Path):
-        """Parse a single view file"""
+        """Parse views and menu items from a single XML file in one pass"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            # Simple approach: look for record tags with model="ir.ui.view"
-            root = ET.fromstring(f"<root>{content}</root>")
-            
-            # Find all record elements
-            for record in root.findall(".//record"):
-                model_attr = record.get('model')
-                if model_attr == 'ir.ui.view':
-                    id_attr = record.get('id')
-                    if id_attr:
-                        # Extract fields
-                        model = None
-                        view_type = None
-                        arch = None
-                        inherit_id = None
-                        priority = 16
-                        field_names = []
-                        
-                        for field in record.findall(".//field"):
-                            name_attr = field.get('name')
-                            if name_attr == 'model':
-                                model = field.text
-                            elif name_attr == 'type':
-                                view_type = field.text
-                            elif name_attr == 'arch':
-                                arch = ET.tostring(field, encoding='unicode')
-                                # Extract field names from the arch
-                                field_names = self._extract_field_names_from_arch(field)
-                            elif name_attr == 'inherit_id':
-                                inherit_id = field.get('ref')
-                            elif name_attr == 'priority':
-                                try:
-                                    priority = int(field.text)
-                                except (ValueError, TypeError):
-                                    pass
-                                    
-                        if model and view_type and arch:
-                            view = OdooView(
-                                name=id_attr,
-                                model=model,
-                                type=view_type,
-                                arch=arch,
-                                inherit_id=inherit_id,
-                                priority=priority,
-                                field_names=field_names
-                            )
-                            self.views[id_attr] = view
-                            
+            for elem in _iter_xml_elements(file_path, VIEW_FILE_EVENTS):
+                if elem.tag == 'menuitem':
+                    self._extract_menu_item(elem)
+                # Simple approach: look for record tags with model="ir.ui.view"
+                elif elem.get('model') == 'ir.ui.view':
+                    self._extract_view(elem)
+                    
         except Exception as e:
             print(f"Error parsing view file {file_path}: {e}")
             
+    def _extract_view(self, record):
+        """Extract an ir.ui.view record"""
+        from lxml import etree
+        
+        id_attr = record.get('id')
+        if id_attr:
+            # Extract fields
+            model = None
+            view_type = None
+            arch = None
+            inherit_id = None
+            priority = 16
+            field_names = []
+            
+            for field in record.iterdescendants("field"):
+                name_attr = field.get('name')
+                if name_attr == 'model':
+                    model = field.text
+                elif name_attr == 'type':
+                    view_type = field.text
+                elif name_attr == 'arch':
+                    # Mid-parse the document has no encoding yet, so libxml2 writes non-ASCII
+                    # attribute values as character references; reparsing the subtree into a
+                    # complete document lets them serialize verbatim, as in the source
+                    arch = etree.tostring(
+                        etree.fromstring(etree.tostring(field, with_tail=False)), encoding='unicode'
+                    ) + (field.tail or '')
+                    # Extract field names from the arch
+                    field_names = self._extract_field_names_from_arch(field)
+                elif name_attr == 'inherit_id':
+                    inherit_id = field.get('ref')
+                elif name_attr == 'priority':
+                    try:
+                        priority = int(field.text)
+                    except (ValueError, TypeError):
+                        pass
+                        
+            if model and view_type and arch:
+                view = OdooView(
+                    name=id_attr,
+                    model=model,
+                    type=view_type,
+                    arch=arch,
+                    inherit_id=inherit_id,
+                    priority=priority,
+                    field_names=field_names
+                )
+                self.views[id_attr] = view
+                
     def _extract_field_names_from_arch(self, arch_node) -> List[str]:
         """Extract field names from view architecture"""
         field_names = []
         
         try:
             # Find all field nodes
-            for field in arch_node.findall(".//field"):
+            for field in arch_node.iterdescendants("field"):
                 name = field.get('name')
                 if name:
                     field_names.append(name)
@@ -444,6 +553,8 @@ class OdooModuleParser:
                     
     def _parse_access_file(self, file_path: Path):
         """Parse ir.model.access.csv file"""
+        import csv
+        
         try:
             with open(file_path, 'r', encoding='utf-8', newline='') as f:
                 reader = csv.DictReader(f)
@@ -464,20 +575,18 @@ class OdooModuleParser:
     def _parse_rule_file(self, file_path: Path):
         """Parse ir.rule XML file"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            root = ET.fromstring(f"<root>{content}</root>")
-            
             # Find all record elements with model="ir.rule"
-            for record in root.findall(".//record[@model='ir.rule']"):
+            for record in _iter_xml_elements(file_path, {'record': 'end'}):
+                if record.get('model') != 'ir.rule':
+                    continue
+                    
                 id_attr = record.get('id', '')
                 
                 model_id = None
                 domain_force = None
                 groups = []
                 
-                for field in record.findall(".//field"):
+                for field in record.iterdescendants("field"):
                     name_attr = field.get('name')
                     if name_attr == 'model_id':
                         ref = field.get('ref')
@@ -486,7 +595,7 @@ class OdooModuleParser:
                     elif name_attr == 'domain_force':
                         domain_force = field.text
                     elif name_attr == 'groups':
-                        for group in field.findall(".//field"):
+                        for group in field.iterdescendants("field"):
                             ref = group.get('ref')
                             if ref:
                                 groups.append(ref)
@@ -507,54 +616,42 @@ class OdooModuleParser:
         except Exception as e:
             print(f"Error parsing rule file {file_path}: {e}")
             
-    def _parse_menus(self):
-        """Parse menu items from XML files"""
-        views_dir = self.module_path / 'views'
-        if views_dir.exists():
-            for file_path in views_dir.glob('*.xml'):
-                self._parse_menu_file(file_path)
-                
-    def _parse_menu_file(self, file_path: Path):
-        """Parse menu items from a single XML file"""
+    def _extract_menu_item(self, menuitem):
+        """Extract a menuitem element; only its attributes are read"""
+        id_attr = menuitem.get('id', '')
+        name = menuitem.get('name', '')
+        parent = menuitem.get('parent', None)
+        action = menuitem.get('action', None)
+        sequence = 10
+        
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            root = ET.fromstring(f"<root>{content}</root>")
+            sequence = int(menuitem.get('sequence', '10'))
+        except ValueError:
+            pass
             
-            # Find all menuitem elements
-            for menuitem in root.findall(".//menuitem"):
-                id_attr = menuitem.get('id', '')
-                name = menuitem.get('name', '')
-                parent = menuitem.get('parent', None)
-                action = menuitem.get('action', None)
-                sequence = 10
-                
-                try:
-                    sequence = int(menuitem.get('sequence', '10'))
-                except ValueError:
-                    pass
-                    
-                groups = []
-                groups_attr = menuitem.get('groups', '')
-                if groups_attr:
-                    groups = groups_attr.split(',')
-                    
-                menu = OdooMenuItem(
-                    id=id_attr,
-                    name=name,
-                    parent_id=parent,
-                    action=action,
-                    sequence=sequence,
-                    groups=groups
-                )
-                self.menu_items[id_attr] = menu
-                
-        except Exception as e:
-            print(f"Error parsing menu file {file_path}: {e}")
+        groups = []
+        groups_attr = menuitem.get('groups', '')
+        if groups_attr:
+            groups = groups_attr.split(',')
             
+        menu = OdooMenuItem(
+            id=id_attr,
+            name=name,
+            parent_id=parent,
+            action=action,
+            sequence=sequence,
+            groups=groups
+        )
+        self.menu_items[id_attr] = menu
+        
     def _analyze_dependencies(self):
         """Analyze model dependencies based on field relationships"""
+        # model -> {field: related model}, so depends paths resolve with plain dict lookups
+        field_index = {
+            name: {fn: f.related_model for fn, f in mdl.fields.items() if f.related_model}
+            for name, mdl in self.models.items()
+        }
+        
         for model_name, model in self.models.items():
             self.model_dependencies[model_name] = set()
             self.field_dependencies[model_name] = set()
@@ -576,16 +673,13 @@ class OdooModuleParser:
                         parts = dependency.split('.')
                         if len(parts) > 1:
                             # This is a relation path like 'partner_id.country_id'
-                            related_model = None
                             current_model = model_name
                             
                             for i, part in enumerate(parts[:-1]):
-                                if part in self.models.get(current_model, OdooModel(name="")).fields:
-                                    field = self.models[current_model].fields[part]
-                                    if field.related_model:
-                                        related_model = field.related_model
-                                        current_model = related_model
-                                        
-                                        # Add this dependency
-                                        if i == 0:  # Only add direct dependencies
-                                            self.field_dependencies[model_name].add((method_name, related_model))
\ No newline at end of file
+                                related_model = field_index.get(current_model, {}).get(part)
+                                if related_model:
+                                    current_model = related_model
+                                    
+                                    # Add this dependency
+                                    if i == 0:  # Only add direct dependencies
+                                        self.field_dependencies[model_name].add((method_name, related_model))
\ No newline at end of file
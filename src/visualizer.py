@@ -1,15 +1,24 @@
 import os
 import json
-from typing import Dict, List, Optional, Tuple
+import functools
+from html import escape
+from collections import Counter
+from dataclasses import asdict
+from operator import itemgetter
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from src.parser import OdooModuleParser
 
-class OdooModuleVisualizer:
-    def __init__(self, parser: OdooModuleParser):
-        self.parser = parser
-        
-    def generate_html(self, output_path: str):
-        """Generate HTML visualization with tree structure"""
-        html_content = """
+@functools.lru_cache(maxsize=None)
+def method_type_label(decorators: Tuple[str, ...]) -> str:
+    """Build the type label shown for a method from its decorators"""
+    return ', '.join(d.replace('@api.', '') for d in decorators) or 'Regular'
+
+def _tooltip_attr(lines: List[str]) -> str:
+    """data-tip attribute holding tooltip lines (title first) for the hover handler"""
+    return f' data-tip="{escape(json.dumps(lines, separators=(",", ":")))}"'
+
+# Static page shell around the generated tree; the fragments go between the two
+TREE_HTML_HEADER = """
         <!DOCTYPE html>
         <html>
         <head>
@@ -243,13 +252,25 @@ class OdooModuleVisualizer:
                     }
                 }
                 
-                // Auto-expand all nodes on load
-                window.onload = function() {
-                    // Expand all model nodes by default
-                    document.querySelectorAll('.expandable').forEach(node => {
-                        node.click();
+                // Tooltips ship as a compact data-tip list and are built on first hover
+                document.addEventListener('mouseover', function(event) {
+                    const node = event.target.closest('[data-tip]');
+                    if (!node || node.querySelector(':scope > .tooltip')) {
+                        return;
+                    }
+                    const tip = document.createElement('div');
+                    tip.className = 'tooltip';
+                    JSON.parse(node.dataset.tip).forEach((line, i) => {
+                        const row = document.createElement('div');
+                        row.className = i === 0 ? 'tooltip-title' : 'tooltip-section';
+                        row.textContent = line;
+                        tip.appendChild(row);
                     });
-                    
+                    node.appendChild(tip);
+                });
+                
+                // Nodes are rendered expanded server-side, so load only wires up scrolling
+                window.onload = function() {
                     // Add scroll event listener
                     window.addEventListener('scroll', function() {
                         const scrollIndicator = document.getElementById('scroll-indicator');
@@ -297,14 +318,8 @@ class OdooModuleVisualizer:
                 </div>
                 <ul>
         """
-        
-        # Add models
-        html_content += self._generate_model_tree()
-        
-        # Add security rules
-        html_content += self._generate_security_tree()
-        
-        html_content += """
+
+TREE_HTML_FOOTER = """
                 </ul>
             </div>
             
@@ -321,66 +336,93 @@ class OdooModuleVisualizer:
         </body>
         </html>
         """
+
+TREE_HTML_HEADER_BYTES = TREE_HTML_HEADER.encode('utf-8')
+TREE_HTML_FOOTER_BYTES = TREE_HTML_FOOTER.encode('utf-8')
+
+class OdooModuleVisualizer:
+    def __init__(self, parser: OdooModuleParser):
+        self.parser = parser
+        # Rendered model nodes by model name; the parser is not mutated after parse_module
+        self._model_html_cache: Dict[str, str] = {}
+        # model -> comodels of its Many2one fields, built on first use
+        self._many2one_targets: Optional[Dict[str, Set[str]]] = None
+        # Models named by any security rule, shared by quality and coverage checks
+        self._rule_model_ids: Optional[Set[str]] = None
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+    def generate_html(self, output_path: str):
+        """Generate HTML visualization with tree structure"""
+        # Fragments go straight to the file instead of through one large string;
+        # the static shell is written pre-encoded
+        with open(output_path, 'wb', buffering=1 << 20) as f:
+            f.write(TREE_HTML_HEADER_BYTES)
+            f.writelines(fragment.encode('utf-8') for fragment in self._iter_tree())
+            f.write(TREE_HTML_FOOTER_BYTES)
+            
+    def generate_html_string(self) -> str:
+        """Build the tree visualization HTML in memory"""
+        return ''.join([TREE_HTML_HEADER, *self._iter_tree(), TREE_HTML_FOOTER])
+        
+    def _iter_tree(self) -> Iterator[str]:
+        """Yield the model and security tree HTML fragment by fragment"""
+        yield from self._generate_model_tree()
+        yield from self._generate_security_tree()
             
-    def _generate_model_tree(self) -> str:
-        """Generate HTML for model tree structure"""
-        html = '<li><div class="node model expandable expanded" onclick="toggleNode(this)"><span class="section-title">📦 Models</span></div><ul>'
+    def _generate_model_tree(self) -> Iterator[str]:
+        """Yield HTML fragments for model tree structure"""
+        yield '<li><div class="node model expandable expanded" onclick="toggleNode(this)"><span class="section-title">📦 Models</span></div><ul>'
         
-        # Add base models first
+        # Partition into base and inherited models in one pass
         base_models = []
-        for model_name, model in self.parser.models.items():
-            if not model.inherit:
-                base_models.append((model_name, model))
-                
-        # Add inherited models
         inherited_models = []
-        for model_name, model in self.parser.models.items():
-            if model.inherit:
-                inherited_models.append((model_name, model))
-                
+        for item in self.parser.models.items():
+            (inherited_models if item[1].inherit else base_models).append(item)
+            
         # Sort models by name
-        base_models.sort(key=lambda x: x[0])
-        inherited_models.sort(key=lambda x: x[0])
+        base_models.sort(key=itemgetter(0))
+        inherited_models.sort(key=itemgetter(0))
         
         # Render base models
         if base_models:
-            html += '<li><div class="node model expandable expanded" onclick="toggleNode(this)">Base Models</div><ul>'
+            yield '<li><div class="node model expandable expanded" onclick="toggleNode(this)">Base Models</div><ul>'
             for model_name, model in base_models:
-                html += self._generate_model_node(model_name, model)
-            html += '</ul></li>'
+                yield self._model_node_html(model_name, model)
+            yield '</ul></li>'
             
         # Render inherited models
         if inherited_models:
-            html += '<li><div class="node model expandable expanded" onclick="toggleNode(this)">Inherited Models</div><ul>'
+            yield '<li><div class="node model expandable expanded" onclick="toggleNode(this)">Inherited Models</div><ul>'
             for model_name, model in inherited_models:
-                html += self._generate_model_node(model_name, model)
-            html += '</ul></li>'
+                yield self._model_node_html(model_name, model)
+            yield '</ul></li>'
         
-        html += '</ul></li>'
-        return html
+        yield '</ul></li>'
         
-    def _generate_model_node(self, model_name: str, model) -> str:
-        """Generate HTML for a single model node"""
-        tooltip = f"""
-            <div class="tooltip">
-                <div class="tooltip-title">Model: {model_name}</div>
-                <div class="tooltip-section">Description: {model.description or "None"}</div>
-                <div class="tooltip-section">Fields: {len(model.fields)}</div>
-                <div class="tooltip-section">Methods: {len(model.methods)}</div>
-                {f'<div class="tooltip-section">Inherits: {", ".join(model.inherit)}</div>' if model.inherit else ""}
-            </div>
-        """
+    def _model_node_html(self, model_name: str, model) -> str:
+        """Rendered HTML for a model node, built once per visualizer"""
+        html = self._model_html_cache.get(model_name)
+        if html is None:
+            html = self._model_html_cache[model_name] = ''.join(self._generate_model_node(model_name, model))
+        return html
         
+    def _generate_model_node(self, model_name: str, model) -> Iterator[str]:
+        """Yield HTML fragments for a single model node"""
+        tip = [
+            f"Model: {model_name}",
+            f"Description: {model.description or 'None'}",
+            f"Fields: {len(model.fields)}",
+            f"Methods: {len(model.methods)}",
+        ]
+        if model.inherit:
+            tip.append(f"Inherits: {', '.join(model.inherit)}")
+            
         field_count = len(model.fields) if model.fields else 0
         
-        html = f'<li><div class="node model expandable expanded" onclick="toggleNode(this)"><div class="model-header">{model_name.split(".")[-1]} <span class="field-count">{field_count} fields</span>{tooltip}</div></div>'
+        yield f'<li><div class="node model expandable expanded" onclick="toggleNode(this)"><div class="model-header"{_tooltip_attr(tip)}>{escape(model_name.split(".")[-1])} <span class="field-count">{field_count} fields</span></div></div>'
         
         # Add fields
         if model.fields:
-            html += '<ul>'
+            yield '<ul>'
             
             # Get field categories
             basic_fields = []
@@ -396,60 +438,55 @@ class OdooModuleVisualizer:
                     basic_fields.append((field_name, field))
             
             # Sort fields by name
-            basic_fields.sort(key=lambda x: x[0])
-            relational_fields.sort(key=lambda x: x[0])
-            computed_fields.sort(key=lambda x: x[0])
+            basic_fields.sort(key=itemgetter(0))
+            relational_fields.sort(key=itemgetter(0))
+            computed_fields.sort(key=itemgetter(0))
             
             # Add basic fields
             if basic_fields:
-                html += '<li><div>Basic Fields</div><div class="field-container">'
+                yield '<li><div>Basic Fields</div><div class="field-container">'
                 for field_name, field in basic_fields:
-                    html += self._generate_field_node(field_name, field)
-                html += '</div></li>'
+                    yield self._generate_field_node(field_name, field)
+                yield '</div></li>'
                 
             # Add relational fields
             if relational_fields:
-                html += '<li><div>Relational Fields</div><div class="field-container">'
+                yield '<li><div>Relational Fields</div><div class="field-container">'
                 for field_name, field in relational_fields:
-                    html += self._generate_field_node(field_name, field)
-                html += '</div></li>'
+                    yield self._generate_field_node(field_name, field)
+                yield '</div></li>'
                 
             # Add computed fields
             if computed_fields:
-                html += '<li><div>Computed Fields</div><div class="field-container">'
+                yield '<li><div>Computed Fields</div><div class="field-container">'
                 for field_name, field in computed_fields:
-                    html += self._generate_field_node(field_name, field)
-                html += '</div></li>'
+                    yield self._generate_field_node(field_name, field)
+                yield '</div></li>'
                 
-            html += '</ul>'
+            yield '</ul>'
         else:
-            html += '<ul><li>No fields defined</li></ul>'
+            yield '<ul><li>No fields defined</li></ul>'
             
-        html += '</li>'
-        return html
+        yield '</li>'
         
     def _generate_field_node(self, field_name: str, field) -> str:
         """Generate HTML for a field node"""
-        tooltip = f"""
-            <div class="tooltip">
-                <div class="tooltip-title">Field: {field_name}</div>
-                <div class="tooltip-section">Type: {field.field_type}</div>
-                <div class="tooltip-section">Required: {field.required}</div>
-                {f'<div class="tooltip-section">Related Model: {field.related_model}</div>' if field.related_model else ""}
-                {f'<div class="tooltip-section">Compute: {field.compute}</div>' if field.compute else ""}
-                <div class="tooltip-section">Readonly: {field.readonly}</div>
-                <div class="tooltip-section">Store: {field.store}</div>
-            </div>
-        """
+        tip = [f"Field: {field_name}", f"Type: {field.field_type}", f"Required: {field.required}"]
+        if field.related_model:
+            tip.append(f"Related Model: {field.related_model}")
+        if field.compute:
+            tip.append(f"Compute: {field.compute}")
+        tip.append(f"Readonly: {field.readonly}")
+        tip.append(f"Store: {field.store}")
         
-        return f'<div class="node field">{field_name} <span class="field-type">({field.field_type})</span>{tooltip}</div>'
+        return f'<div class="node field"{_tooltip_attr(tip)}>{escape(field_name)} <span class="field-type">({escape(field.field_type)})</span></div>'
         
-    def _generate_security_tree(self) -> str:
-        """Generate HTML for security rules tree structure"""
+    def _generate_security_tree(self) -> Iterator[str]:
+        """Yield HTML fragments for security rules tree structure"""
         if not self.parser.security_rules:
-            return ""
+            return
             
-        html = '<li><div class="node security expandable expanded" onclick="toggleNode(this)"><span class="section-title">🔐 Security Rules</span></div><ul>'
+        yield '<li><div class="node security expandable expanded" onclick="toggleNode(this)"><span class="section-title">🔐 Security Rules</span></div><ul>'
         
         # Group rules by model
         model_rules = {}
@@ -464,121 +501,122 @@ class OdooModuleVisualizer:
         
         for model_id in sorted_models:
             rules = model_rules[model_id]
-            html += f'<li><div class="node security expandable" onclick="toggleNode(this)">{model_id} ({len(rules)} rules)</div><ul class="hidden">'
+            yield f'<li><div class="node security expandable expanded" onclick="toggleNode(this)">{escape(model_id)} ({len(rules)} rules)</div><ul>'
             
-            for rule_name, rule in sorted(rules, key=lambda x: x[0]):
-                tooltip = f"""
-                    <div class="tooltip">
-                        <div class="tooltip-title">Rule: {rule_name}</div>
-                        <div class="tooltip-section">Model: {rule.model_id}</div>
-                        <div class="tooltip-section">Groups: {', '.join(rule.groups)}</div>
-                        <div class="tooltip-section">Permissions:</div>
-                        <div>Read: {rule.perm_read}</div>
-                        <div>Write: {rule.perm_write}</div>
-                        <div>Create: {rule.perm_create}</div>
-                        <div>Unlink: {rule.perm_unlink}</div>
-                    </div>
-                """
-                html += f'<li><div class="node security">{rule_name}{tooltip}</div></li>'
+            for rule_name, rule in sorted(rules, key=itemgetter(0)):
+                tip = [
+                    f"Rule: {rule_name}",
+                    f"Model: {rule.model_id}",
+                    f"Groups: {', '.join(rule.groups)}",
+                    "Permissions:",
+                    f"Read: {rule.perm_read}",
+                    f"Write: {rule.perm_write}",
+                    f"Create: {rule.perm_create}",
+                    f"Unlink: {rule.perm_unlink}",
+                ]
+                yield f'<li><div class="node security"{_tooltip_attr(tip)}>{escape(rule_name)}</div></li>'
                 
-            html += '</ul></li>'
+            yield '</ul></li>'
             
-        html += '</ul></li>'
-        return html
+        yield '</ul></li>'
 
     def generate_relationship_graph(self) -> Tuple[List[dict], List[dict]]:
         """Generate nodes and edges for model relationships visualization"""
-        nodes = []
-        edges = []
+        models = self.parser.models
         
         # Add model nodes
-        for model_name, model in self.parser.models.items():
-            nodes.append({
+        nodes = [
+            {
                 'id': model_name,
                 'label': model_name,
                 'type': 'model',
                 'fields': len(model.fields),
                 'methods': len(model.methods),
                 'description': model.description
-            })
-            
+            }
+            for model_name, model in models.items()
+        ]
+        
+        edges = []
+        add_edges = edges.extend
+        for model_name, model in models.items():
             # Add inheritance edges
-            for inherit in model.inherit:
-                edges.append({
-                    'from': model_name,
-                    'to': inherit,
-                    'type': 'inherits',
-                    'label': 'inherits'
-                })
-                
+            add_edges(
+                {'from': model_name, 'to': inherit, 'type': 'inherits', 'label': 'inherits'}
+                for inherit in model.inherit
+            )
+            
             # Add field relationship edges
             for field_name, field in model.fields.items():
-                if field.related_model:
+                related_model = field.related_model
+                if related_model:
+                    field_type = field.field_type
                     edges.append({
                         'from': model_name,
-                        'to': field.related_model,
-                        'type': field.field_type,
-                        'label': field.field_type,
+                        'to': related_model,
+                        'type': field_type,
+                        'label': field_type,
                         'field': field_name
                     })
-        
+                    
         return nodes, edges
     
-    def export_module_data(self, output_path: str):
-        """Export module data to JSON for external use"""
+    def export_module_data(self, output_path: str, pretty: bool = False):
+        """Export module data to JSON for external use; pretty indents the output"""
         module_data = {
             'module_name': os.path.basename(self.parser.module_path),
-            'models': {},
-            'security_rules': {},
-            'views': {}
-        }
-        
-        # Export models
-        for model_name, model in self.parser.models.items():
-            model_data = {
-                'name': model.name,
-                'description': model.description,
-                'inherit': model.inherit,
-                'fields': {},
-                'methods': model.methods
-            }
-            
-            # Export fields
-            for field_name, field in model.fields.items():
-                model_data['fields'][field_name] = {
-                    'type': field.field_type,
-                    'required': field.required,
-                    'related_model': field.related_model,
-                    'compute': field.compute,
-                    'store': field.store,
-                    'readonly': field.readonly
+            'models': {
+                model_name: {
+                    'name': model.name,
+                    'description': model.description,
+                    'inherit': model.inherit,
+                    'fields': {
+                        field_name: {
+                            'type': field.field_type,
+                            'required': field.required,
+                            'related_model': field.related_model,
+                            'compute': field.compute,
+                            'store': field.store,
+                            'readonly': field.readonly
+                        }
+                        for field_name, field in model.fields.items()
+                    },
+                    # OdooMethod records are dataclasses, which json cannot encode directly
+                    'methods': {method_name: asdict(method) for method_name, method in model.methods.items()}
                 }
-                
-            module_data['models'][model_name] = model_data
-            
-        # Export security rules
-        for rule_name, rule in self.parser.security_rules.items():
-            module_data['security_rules'][rule_name] = {
-                'model_id': rule.model_id,
-                'groups': rule.groups,
-                'perm_read': rule.perm_read,
-                'perm_write': rule.perm_write,
-                'perm_create': rule.perm_create,
-                'perm_unlink': rule.perm_unlink
-            }
-            
-        # Export views
-        for view_name, view in self.parser.views.items():
-            module_data['views'][view_name] = {
-                'model': view.model,
-                'type': view.type,
-                'inherit_id': view.inherit_id,
-                'priority': view.priority
+                for model_name, model in self.parser.models.items()
+            },
+            'security_rules': {
+                rule_name: {
+                    'model_id': rule.model_id,
+                    'groups': rule.groups,
+                    'perm_read': rule.perm_read,
+                    'perm_write': rule.perm_write,
+                    'perm_create': rule.perm_create,
+                    'perm_unlink': rule.perm_unlink
+                }
+                for rule_name, rule in self.parser.security_rules.items()
+            },
+            'views': {
+                view_name: {
+                    'model': view.model,
+                    'type': view.type,
+                    'inherit_id': view.inherit_id,
+                    'priority': view.priority
+                }
+                for view_name, view in self.parser.views.items()
             }
+        }
+        
+        # Serialize in one shot: json.dump streams through the pure-Python encoder,
+        # while compact dumps() runs in the C encoder
+        if pretty:
+            data = json.dumps(module_data, indent=2)
+        else:
+            data = json.dumps(module_data, separators=(',', ':'))
             
-        # Write to file
         with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(module_data, f, indent=2)
+            f.write(data)
             
         return output_path
     
@@ -592,120 +630,112 @@ class OdooModuleVisualizer:
             'performance_concerns': []
         }
         
+        missing_descriptions = metrics['missing_descriptions']
+        unused_fields = metrics['unused_fields']
+        performance_concerns = metrics['performance_concerns']
+        
         # Check for missing descriptions
         for model_name, model in self.parser.models.items():
             if not model.description:
-                metrics['missing_descriptions'].append(f"Model {model_name} has no description")
+                missing_descriptions.append(f"Model {model_name} has no description")
             
-            # Check for unused fields (One2many fields with no inverse Many2one)
             for field_name, field in model.fields.items():
-                if field.field_type == 'One2many':
-                    if field.related_model and not self._has_inverse_field(model_name, field):
-                        metrics['unused_fields'].append(f"Field {model_name}.{field_name} might be unused (no inverse Many2one field found)")
+                # Check for unused fields (One2many fields with no inverse Many2one)
+                if (field.field_type == 'One2many' and field.related_model
+                        and not self._has_inverse_field(model_name, field)):
+                    unused_fields.append(f"Field {model_name}.{field_name} might be unused (no inverse Many2one field found)")
                 
                 # Check for non-stored computed fields that might impact performance
                 if field.compute and not field.store:
-                    metrics['performance_concerns'].append(f"Non-stored computed field {model_name}.{field_name} might impact performance")
+                    performance_concerns.append(f"Non-stored computed field {model_name}.{field_name} might impact performance")
         
         # Check for security issues
-        model_access = set()
-        for rule in self.parser.security_rules.values():
-            model_access.add(rule.model_id)
-            
+        model_access = self._models_with_access_rules()
         for model_name in self.parser.models:
             if model_name not in model_access:
                 metrics['security_issues'].append(f"Model {model_name} has no access rules defined")
                 
         return metrics
     
+    def _models_with_access_rules(self) -> Set[str]:
+        """Model names referenced by at least one security rule, collected once"""
+        if self._rule_model_ids is None:
+            self._rule_model_ids = {rule.model_id for rule in self.parser.security_rules.values()}
+        return self._rule_model_ids
+        
     def _has_inverse_field(self, model_name: str, one2many_field) -> bool:
         """Check if a One2many field has an inverse Many2one field in the related model"""
-        related_model_name = one2many_field.related_model
-        if related_model_name not in self.parser.models:
-            return False
-            
-        related_model = self.parser.models[related_model_name]
-        for field in related_model.fields.values():
-            if field.field_type == 'Many2one' and field.related_model == model_name:
-                return True
-                
-        return False
+        if self._many2one_targets is None:
+            self._many2one_targets = {
+                name: {f.related_model for f in model.fields.values() if f.field_type == 'Many2one'}
+                for name, model in self.parser.models.items()
+            }
+        return model_name in self._many2one_targets.get(one2many_field.related_model, ())
     
     def get_module_stats(self) -> Dict:
         """Get comprehensive statistics about the module"""
-        stats = {
+        # One pass over the models for type counts, sizes and inheritance
+        field_types = Counter()
+        model_size = {}
+        models_inheriting = 0
+        for model in self.parser.models.values():
+            field_types.update(field.field_type for field in model.fields.values())
+            model_size[model.name] = {
+                'fields': len(model.fields),
+                'methods': len(model.methods)
+            }
+            if model.inherit:
+                models_inheriting += 1
+                
+        return {
             'total_models': len(self.parser.models),
-            'total_fields': sum(len(model.fields) for model in self.parser.models.values()),
-            'total_methods': sum(len(model.methods) for model in self.parser.models.values()),
-            'field_types': {},
-            'model_size': {},
+            'total_fields': self.parser.total_fields,
+            'total_methods': self.parser.total_methods,
+            'field_types': dict(field_types),
+            'model_size': model_size,
             'inheritance': {
-                'models_inheriting': len([m for m in self.parser.models.values() if m.inherit]),
+                'models_inheriting': models_inheriting,
                 'inheritance_chains': self._get_inheritance_chains()
             },
-            'views_by_type': {},
+            'views_by_type': dict(Counter(view.type for view in self.parser.views.values())),
             'security_coverage': self._get_security_coverage()
         }
-        
-        # Count field types
-        for model in self.parser.models.values():
-            for field in model.fields.values():
-                if field.field_type not in stats['field_types']:
-                    stats['field_types'][field.field_type] = 0
-                stats['field_types'][field.field_type] += 1
-                
-            # Model size metrics
-            stats['model_size'][model.name] = {
-                'fields': len(model.fields),
-                'methods': len(model.methods)
-            }
-            
-        # Count view types
-        for view in self.parser.views.values():
-            if view.type not in stats['views_by_type']:
-                stats['views_by_type'][view.type] = 0
-            stats['views_by_type'][view.type] += 1
-            
-        return stats
     
     def _get_inheritance_chains(self) -> List[List[str]]:
-        """Get chains of model inheritance"""
+        """Get chains of model inheritance, one per path from a model to a root ancestor"""
         chains = []
         models = self.parser.models
+        # Every name placed on a chain, so covered models are not walked again
+        seen = set()
         
-        def build_chain(model_name, chain=None):
-            if chain is None:
-                chain = []
-                
-            chain.append(model_name)
-            
-            if model_name in models and models[model_name].inherit:
-                for parent in models[model_name].inherit:
-                    new_chain = chain.copy()
-                    if parent in models:
-                        build_chain(parent, new_chain)
-                        chains.append(new_chain)
-                    else:
-                        new_chain.append(parent)
-                        chains.append(new_chain)
-            else:
-                chains.append(chain)
+        for root in models:
+            if root in seen:
+                continue
                 
-        for model_name in models:
-            if not any(model_name in chain for chain in chains):
-                build_chain(model_name)
+            # Iterative DFS over one shared path; a chain is copied out only at a leaf
+            path = []
+            stack = [(root, 0, False)]
+            while stack:
+                model_name, depth, terminal = stack.pop()
+                del path[depth:]
+                path.append(model_name)
+                seen.add(model_name)
                 
+                parents = None if terminal or model_name not in models else models[model_name].inherit
+                if parents:
+                    for parent in reversed(parents):
+                        # A parent already on the path (e.g. _inherit of its own _name) ends the chain
+                        stack.append((parent, depth + 1, parent in path))
+                else:
+                    chains.append(path.copy())
+                    
         return chains
     
     def _get_security_coverage(self) -> Dict:
         """Calculate security coverage stats"""
         total_models = len(self.parser.models)
-        models_with_rules = set()
+        models_with_rules = self._models_with_access_rules() & self.parser.models.keys()
         
-        for rule in self.parser.security_rules.values():
-            if rule.model_id in self.parser.models:
-                models_with_rules.add(rule.model_id)
-                
         return {
             'models_with_rules': len(models_with_rules),
             'coverage_percentage': round(len(models_with_rules) / total_models * 100, 2) if total_models > 0 else 0,
@@ -0,0 +1,157 @@
+from src.parser import OdooModuleParser
+
+
+def _parse(module_path):
+    parser = OdooModuleParser(str(module_path))
+    parser.parse_module()
+    return parser
+
+
+def test_manifest_with_indented_dict(tmp_path):
+    (tmp_path / '__manifest__.py').write_text(
+        "# -*- coding: utf-8 -*-\n"
+        "  {\n"
+        "    'name': 'Indented # not a comment',\n"
+        "    'depends': ['base'],  # trailing comment\n"
+        "  }\n",
+        encoding='utf-8'
+    )
+    
+    parser = _parse(tmp_path)
+    
+    assert parser.manifest == {'name': 'Indented # not a comment', 'depends': ['base']}
+
+
+def test_view_arch_keeps_non_ascii_text(tmp_path):
+    views_dir = tmp_path / 'views'
+    views_dir.mkdir()
+    (views_dir / 'partner_views.xml').write_text(
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<odoo>\n'
+        '    <record id="view_partner_form" model="ir.ui.view">\n'
+        '        <field name="model">res.partner</field>\n'
+        '        <field name="type">form</field>\n'
+        '        <field name="arch" type="xml">\n'
+        '            <form string="Übersicht">\n'
+        '                <field name="name" string="Grüße"/>\n'
+        '                <label string="日本">Straße</label>\n'
+        '            </form>\n'
+        '        </field>\n'
+        '    </record>\n'
+        '</odoo>\n',
+        encoding='utf-8'
+    )
+    
+    parser = _parse(tmp_path)
+    arch = parser.views['view_partner_form'].arch
+    
+    assert '<form string="Übersicht">' in arch
+    assert '<field name="name" string="Grüße"/>' in arch
+    assert '<label string="日本">Straße</label>' in arch
+    assert '&#x' not in arch
+    assert parser.views['view_partner_form'].field_names == ['name']
+
+
+def test_view_file_records_and_nested_menus(tmp_path):
+    views_dir = tmp_path / 'views'
+    views_dir.mkdir()
+    (views_dir / 'todo_views.xml').write_text(
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<odoo>\n'
+        '    <record id="view_task_tree" model="ir.ui.view">\n'
+        '        <field name="model">todo.task</field>\n'
+        '        <field name="type">tree</field>\n'
+        '        <field name="arch" type="xml"><tree><field name="name"/></tree></field>\n'
+        '    </record>\n'
+        '    <record id="action_task" model="ir.actions.act_window">\n'
+        '        <field name="res_model">todo.task</field>\n'
+        '    </record>\n'
+        '    <menuitem id="menu_root" name="Todo" sequence="5">\n'
+        '        <menuitem id="menu_tasks" name="Tasks" parent="menu_root" action="action_task" sequence="20"/>\n'
+        '        <menuitem id="menu_config" name="Configuration" parent="menu_root" groups="base.group_system,base.group_erp_manager">\n'
+        '            <menuitem id="menu_tags" name="Tags" parent="menu_config" action="action_tag"/>\n'
+        '        </menuitem>\n'
+        '    </menuitem>\n'
+        '    <record id="view_task_form" model="ir.ui.view">\n'
+        '        <field name="model">todo.task</field>\n'
+        '        <field name="type">form</field>\n'
+        '        <field name="inherit_id" ref="base_view_task_form"/>\n'
+        '        <field name="priority">8</field>\n'
+        '        <field name="arch" type="xml"><form><field name="name"/><field name="tag_ids"/></form></field>\n'
+        '    </record>\n'
+        '</odoo>\n',
+        encoding='utf-8'
+    )
+    
+    parser = _parse(tmp_path)
+    
+    assert list(parser.views) == ['view_task_tree', 'view_task_form']
+    tree_view = parser.views['view_task_tree']
+    assert (tree_view.model, tree_view.type, tree_view.field_names) == ('todo.task', 'tree', ['name'])
+    assert tree_view.arch == '<field name="arch" type="xml"><tree><field name="name"/></tree></field>\n    '
+    form_view = parser.views['view_task_form']
+    assert (form_view.model, form_view.type, form_view.inherit_id, form_view.priority) == (
+        'todo.task', 'form', 'base_view_task_form', 8
+    )
+    assert form_view.field_names == ['name', 'tag_ids']
+    
+    menus = parser.menu_items
+    assert list(menus) == ['menu_root', 'menu_tasks', 'menu_config', 'menu_tags']
+    assert [(m.name, m.parent_id, m.action, m.sequence, m.groups) for m in menus.values()] == [
+        ('Todo', None, None, 5, []),
+        ('Tasks', 'menu_root', 'action_task', 20, []),
+        ('Configuration', 'menu_root', None, 10, ['base.group_system', 'base.group_erp_manager']),
+        ('Tags', 'menu_config', 'action_tag', 10, []),
+    ]
+
+
+def test_rule_file_extracts_each_record(tmp_path):
+    security_dir = tmp_path / 'security'
+    security_dir.mkdir()
+    (security_dir / 'todo_rules.xml').write_text(
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<odoo>\n'
+        '    <record id="rule_task_own" model="ir.rule">\n'
+        '        <field name="name">Own tasks</field>\n'
+        '        <field name="model_id" ref="model_todo_task"/>\n'
+        '        <field name="domain_force">[(\'user_id\', \'=\', user.id)]</field>\n'
+        '        <field name="groups">\n'
+        '            <field ref="base.group_user"/>\n'
+        '            <field ref="base.group_portal"/>\n'
+        '        </field>\n'
+        '    </record>\n'
+        '    <record id="group_todo_manager" model="res.groups">\n'
+        '        <field name="name">Todo Manager</field>\n'
+        '    </record>\n'
+        '    <record id="rule_tag_all" model="ir.rule">\n'
+        '        <field name="model_id" ref="model_todo_tag"/>\n'
+        '        <field name="domain_force">[(1, \'=\', 1)]</field>\n'
+        '        <field name="groups">\n'
+        '            <field ref="group_todo_manager"/>\n'
+        '        </field>\n'
+        '    </record>\n'
+        '    <record id="rule_task_company" model="ir.rule">\n'
+        '        <field name="model_id" ref="model_todo_task"/>\n'
+        '    </record>\n'
+        '</odoo>\n',
+        encoding='utf-8'
+    )
+    
+    parser = _parse(tmp_path)
+    rules = parser.security_rules
+    
+    assert list(rules) == ['rule_task_own', 'rule_tag_all', 'rule_task_company']
+    own = rules['rule_task_own']
+    assert (own.name, own.model_id, own.groups, own.domain_force) == (
+        'rule_task_own', 'todo_task', ['base.group_user', 'base.group_portal'], "[('user_id', '=', user.id)]"
+    )
+    tag = rules['rule_tag_all']
+    assert (tag.name, tag.model_id, tag.groups, tag.domain_force) == (
+        'rule_tag_all', 'todo_tag', ['group_todo_manager'], "[(1, '=', 1)]"
+    )
+    company = rules['rule_task_company']
+    assert (company.model_id, company.groups, company.domain_force) == ('todo_task', [], None)
+    assert all(
+        (rule.perm_read, rule.perm_write, rule.perm_create, rule.perm_unlink) == (True, True, True, True)
+        for rule in rules.values()
+    )
@@ -0,0 +1,65 @@
+from src.parser import OdooModuleParser
+from src.visualizer import OdooModuleVisualizer
+
+
+CHAIN_MODELS = '''
+from odoo import models
+
+
+class Child(models.Model):
+    _name = 'chain.child'
+    _inherit = 'chain.parent'
+
+
+class Parent(models.Model):
+    _name = 'chain.parent'
+    _inherit = 'chain.base'
+
+
+class Base(models.Model):
+    _name = 'chain.base'
+
+
+class Bottom(models.Model):
+    _name = 'diamond.bottom'
+    _inherit = ['diamond.left', 'diamond.right']
+
+
+class Left(models.Model):
+    _name = 'diamond.left'
+    _inherit = 'diamond.top'
+
+
+class Right(models.Model):
+    _name = 'diamond.right'
+    _inherit = 'diamond.top'
+
+
+class Top(models.Model):
+    _name = 'diamond.top'
+
+
+class SelfInherit(models.Model):
+    _name = 'self.model'
+    _inherit = ['self.model', 'mail.thread']
+'''
+
+
+def test_inheritance_chains(tmp_path):
+    models_dir = tmp_path / 'models'
+    models_dir.mkdir()
+    (models_dir / 'chains.py').write_text(CHAIN_MODELS, encoding='utf-8')
+    parser = OdooModuleParser(str(tmp_path))
+    parser.parse_module()
+    
+    chains = OdooModuleVisualizer(parser).get_module_stats()['inheritance']['inheritance_chains']
+    
+    # One chain per leaf path; ancestors already covered are not repeated as their own
+    # prefixes, and a model inheriting its own _name ends its chain instead of recursing
+    assert chains == [
+        ['chain.child', 'chain.parent', 'chain.base'],
+        ['diamond.bottom', 'diamond.left', 'diamond.top'],
+        ['diamond.bottom', 'diamond.right', 'diamond.top'],
+        ['self.model', 'self.model'],
+        ['self.model', 'mail.thread'],
+    ]